@@ -5,18 +5,333 @@ Provides easy interface for Streamlit dashboard
 """
 
 import subprocess
+import threading
+import queue
 import os
+import numpy as np
 import pandas as pd
 import time
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from pandas.api.types import union_categoricals
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # fall back to pandas' C parser
+    pa = None
+
+try:
+    from numba import njit
+except ImportError:  # fall back to the numpy kernels
+    njit = None
+
+# Column types of the CSV files exported by the C++ engine. Floats are read as
+# float32 outright; unsigned columns are narrowed further after loading.
+_SIGNALS_DTYPES = {
+    'timestamp': 'int64',
+    'signal_id': 'int64',
+    'type': 'str',
+    'primary_symbol': 'str',
+    'secondary_symbol': 'str',
+    'signal_strength': 'float32',
+    'confidence': 'float32',
+    'latency_us': 'int64',
+}
+
+# Rows per block when the pandas fallback reads a CSV incrementally
+_CSV_CHUNK_ROWS = 64 * 1024
+
+# String columns of signals.csv that hold labels rather than free text
+_SIGNALS_LABEL_COLUMNS = ('type', 'primary_symbol', 'secondary_symbol')
+
+_LATENCY_DTYPES = {
+    'lower_bound_us': 'int64',
+    'upper_bound_us': 'int64',
+    'count': 'int64',
+    'percentage': 'float32',
+}
+
+# Engine stdout buffering: userspace buffer size and the most taken per read
+PIPE_BUFFER_SIZE = 256 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+# Most raw output decoded per streaming step
+MAX_BYTES_PER_STEP = 4 * 1024 * 1024
+
+# Start of the JSON line an engine in --serve mode ends each run with
+_SERVE_REPLY_PREFIX = b'{"'
+
+# Final-results line prefix -> (metric key, value converter)
+_METRIC_PARSERS = {
+    "Total Ticks Processed:": ("total_ticks", int),
+    "Total Signals:": ("total_signals", int),
+    "Average Rate:": ("average_rate", lambda s: float(s.replace(" TPS", ""))),
+    "Queue Drop Rate:": ("drop_rate", lambda s: float(s.rstrip("%"))),
+}
+
+_METRIC_PREFIXES_B = tuple(prefix.encode() for prefix in _METRIC_PARSERS)
+_FRAME_CHARS_B = " ║".encode()
+
+def update_metrics(line: str, metrics: Dict[str, Any]) -> None:
+    """Parse a single line of C++ output, updating metrics in place"""
+    # Final results are framed by box-drawing borders ("║ Total Signals: 12 ║")
+    line = line.strip().strip("║").strip()
+
+    for prefix, (key, convert) in _METRIC_PARSERS.items():
+        if line.startswith(prefix):
+            try:
+                metrics[key] = convert(line.split(':', 1)[1].strip())
+            except ValueError:
+                pass
+            return
+
+def update_metrics_from_bytes(data: bytes, metrics: Dict[str, Any]) -> None:
+    """Parse metrics from a block of raw C++ output, updating metrics in place"""
+    # Almost no blocks contain a results line; a C-level substring scan rejects
+    # those without decoding a single byte
+    if not any(prefix in data for prefix in _METRIC_PREFIXES_B):
+        return
+
+    for line in data.splitlines():
+        if line.lstrip(_FRAME_CHARS_B).startswith(_METRIC_PREFIXES_B):
+            update_metrics(line.decode('utf-8', errors='replace'), metrics)
+
+def _arrow_type(alias: str):
+    """Arrow type for a dtype alias; 'category' becomes dictionary-encoded strings"""
+    if alias == 'category':
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.type_for_alias(alias)
+
+def _select_dtypes(dtypes: Dict[str, str],
+                   columns: Optional[List[str]]) -> Dict[str, str]:
+    return dtypes if columns is None else {name: dtypes[name] for name in columns}
+
+def _convert_options(dtypes: Dict[str, str], columns: Optional[List[str]]):
+    return pa_csv.ConvertOptions(
+        column_types={name: _arrow_type(alias) for name, alias in dtypes.items()},
+        include_columns=columns or [],
+        strings_can_be_null=True  # empty secondary_symbol -> NaN, as with pandas
+    )
+
+def _find_serve_reply(data: bytes) -> int:
+    """Offset of the --serve reply line in a block of whole lines, or -1"""
+    if data.startswith(_SERVE_REPLY_PREFIX):
+        return 0
+    start = data.find(b'\n' + _SERVE_REPLY_PREFIX)
+    return start + 1 if start >= 0 else -1
+
+def _read_engine_csv(path, dtypes: Dict[str, str],
+                     columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read an engine CSV with fixed column types, skipping type inference"""
+    dtypes = _select_dtypes(dtypes, columns)
+
+    if pa is None:
+        return pd.read_csv(path, usecols=columns, dtype=dtypes, engine="c")
+
+    convert_options = _convert_options(dtypes, columns)
+    return pa_csv.read_csv(path, convert_options=convert_options).to_pandas()
+
+def _iter_engine_csv(path, dtypes: Dict[str, str],
+                     columns: Optional[List[str]] = None):
+    """Yield an engine CSV as consecutive DataFrames, parsed block by block"""
+    dtypes = _select_dtypes(dtypes, columns)
+
+    if pa is None:
+        yield from pd.read_csv(path, usecols=columns, dtype=dtypes,
+                               chunksize=_CSV_CHUNK_ROWS, engine="c")
+        return
+
+    with pa_csv.open_csv(path, convert_options=_convert_options(dtypes, columns)) as reader:
+        for batch in reader:
+            yield batch.to_pandas()
+
+def _downcast_unsigned(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Shrink non-negative integer columns to the smallest unsigned type that fits"""
+    # Charts and tables ship these arrays to the browser, so width is payload
+    for name in columns:
+        if name in df.columns:
+            df[name] = pd.to_numeric(df[name], downcast='unsigned')
+    return df
+
+def _share_symbol_categories(signals_df: pd.DataFrame) -> None:
+    """Give both categorical symbol columns one category list, in place"""
+    # A symbol then has the same code in either column, so filters on it
+    # compare both columns against a single integer
+    if not {'primary_symbol', 'secondary_symbol'} <= set(signals_df.columns):
+        return
+    symbols = union_categoricals(
+        [signals_df['primary_symbol'], signals_df['secondary_symbol']],
+        sort_categories=True
+    ).categories
+    for name in ('primary_symbol', 'secondary_symbol'):
+        signals_df[name] = signals_df[name].cat.set_categories(symbols)
+
+def read_signals_csv(path, columns: Optional[List[str]] = None,
+                     categorical: bool = False) -> pd.DataFrame:
+    """
+    Load a signals.csv exported by the C++ engine
+
+    Args:
+        path: CSV file to read
+        columns: Only read these columns
+        categorical: Read the signal type and symbols as categoricals, the
+            two symbol columns sharing one category list
+    """
+    dtypes = _SIGNALS_DTYPES
+    if categorical:
+        # A handful of distinct short strings repeated on every row
+        dtypes = {**dtypes, **{name: 'category' for name in _SIGNALS_LABEL_COLUMNS}}
+    signals_df = _read_engine_csv(path, dtypes, columns)
+    if categorical:
+        # Arrow lists dictionary values in file order; sort them so codes and
+        # category order match sample_signals_csv for the same file
+        if 'type' in signals_df.columns:
+            types = signals_df['type'].cat
+            signals_df['type'] = types.reorder_categories(sorted(types.categories))
+        _share_symbol_categories(signals_df)
+    return _downcast_unsigned(signals_df, ['signal_id', 'latency_us'])
+
+def sample_signals_csv(path, size: int, columns: Optional[List[str]] = None,
+                       categorical: bool = False, seed: Optional[int] = 0):
+    """
+    Uniform random sample of a signals.csv, kept in file order
+
+    The file is parsed block by block and never held in memory whole. Every
+    row draws a random key and the size rows with the smallest keys are kept,
+    so files of at most size rows come back complete.
+
+    Args:
+        path: CSV file to read
+        size: Most rows to return
+        columns: Only read these columns
+        categorical: Return the signal type and symbols as categoricals, the
+            two symbol columns sharing one category list
+        seed: Random seed, fixed by default so reloads give the same sample
+
+    Returns:
+        (sample DataFrame, total number of signals in the file)
+    """
+    rng = np.random.default_rng(seed)
+    sample, keys, total = None, None, 0
+
+    for chunk in _iter_engine_csv(path, _SIGNALS_DTYPES, columns):
+        chunk.index = pd.RangeIndex(total, total + len(chunk))  # file row numbers
+        total += len(chunk)
+        chunk_keys = rng.random(len(chunk))
+
+        if sample is None:
+            sample, keys = chunk, chunk_keys
+        else:
+            sample = pd.concat([sample, chunk])
+            keys = np.concatenate([keys, chunk_keys])
+        if len(sample) > size:
+            keep = np.argpartition(keys, size)[:size]
+            sample, keys = sample.iloc[keep], keys[keep]
+
+    if sample is None:  # header only
+        sample = _read_engine_csv(path, _SIGNALS_DTYPES, columns)
+    sample = sample.sort_index().reset_index(drop=True)
+
+    if categorical:
+        # Converted once at the end; per-block categories wouldn't concatenate
+        for name in _SIGNALS_LABEL_COLUMNS:
+            if name in sample.columns:
+                sample[name] = sample[name].astype('category')
+        _share_symbol_categories(sample)
+    return _downcast_unsigned(sample, ['signal_id', 'latency_us']), total
+
+def read_latency_csv(path) -> pd.DataFrame:
+    """Load a latency_histogram.csv exported by the C++ engine"""
+    latency_df = _read_engine_csv(path, _LATENCY_DTYPES)
+    return _downcast_unsigned(latency_df, ['lower_bound_us', 'upper_bound_us', 'count'])
+
+def _percentile_bounds_numpy(counts, bounds, quantiles):
+    cumulative = np.cumsum(counts)
+    idx = np.searchsorted(cumulative, quantiles * cumulative[-1], side='left')
+    return bounds[np.minimum(idx, len(bounds) - 1)]
+
+def _percentile_bounds_loop(counts, bounds, quantiles):
+    # Same result as the numpy kernel: the first bucket whose cumulative count
+    # reaches each target, else the last bucket
+    total = counts.sum()
+    result = np.empty(quantiles.shape[0], dtype=bounds.dtype)
+    for j in range(quantiles.shape[0]):
+        target = quantiles[j] * total
+        result[j] = bounds[-1]
+        cumulative = 0
+        for i in range(counts.shape[0]):
+            cumulative += counts[i]
+            if cumulative >= target:
+                result[j] = bounds[i]
+                break
+    return result
+
+def _bin_counts_numpy(bin_idx, type_codes, n_bins, n_types):
+    flat = np.bincount(bin_idx * n_types + type_codes, minlength=n_bins * n_types)
+    return flat.reshape(n_bins, n_types)
+
+def _bin_counts_loop(bin_idx, type_codes, n_bins, n_types):
+    counts = np.zeros((n_bins, n_types), dtype=np.int64)
+    for i in range(bin_idx.shape[0]):
+        counts[bin_idx[i], type_codes[i]] += 1
+    return counts
+
+# Compiled once and cached on disk by numba when it's installed
+if njit is not None:
+    _percentile_bounds = njit(cache=True)(_percentile_bounds_loop)
+    _bin_counts = njit(cache=True)(_bin_counts_loop)
+else:
+    _percentile_bounds = _percentile_bounds_numpy
+    _bin_counts = _bin_counts_numpy
+
+def latency_percentiles(latency_df: pd.DataFrame, quantiles) -> np.ndarray:
+    """Upper bound (μs) of the histogram bucket holding each quantile in [0, 1]"""
+    return _percentile_bounds(
+        latency_df['count'].to_numpy(),
+        latency_df['upper_bound_us'].to_numpy(),
+        np.asarray(quantiles, dtype=np.float64)
+    )
+
+def time_type_counts(t: np.ndarray, type_codes: np.ndarray, n_bins: int, n_types: int):
+    """
+    Count events per (equal-width time window, type)
+
+    Args:
+        t: Event times
+        type_codes: Integer type of each event, in [0, n_types)
+        n_bins: Number of time windows spanning t's range
+        n_types: Number of distinct types
+
+    Returns:
+        (window edges, n_bins x n_types array of counts)
+    """
+    if len(t):
+        edges = np.linspace(t.min(), t.max(), n_bins + 1)
+    else:
+        edges = np.zeros(n_bins + 1)
+    bin_idx = np.clip(np.searchsorted(edges, t, side='right') - 1, 0, n_bins - 1)
+    return edges, _bin_counts(bin_idx, type_codes.astype(np.intp), n_bins, n_types)
+
+def clear_csv_files(data_dir) -> None:
+    """Delete CSV exports left over from a previous run"""
+    if not os.path.isdir(data_dir):
+        return
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.csv') and entry.is_file():
+                os.unlink(entry.path)
 
 class TradingSystemWrapper:
     def __init__(self, build_dir: str = "build"):
         self.build_dir = Path(build_dir)
         self.executable = self.build_dir / "demo_realtime"
         self.data_dir = Path("data")
+        self.signals_path = self.data_dir / "signals.csv"
+        self.latency_path = self.data_dir / "latency_histogram.csv"
 
         # Ensure data directory exists
         self.data_dir.mkdir(exist_ok=True)
@@ -25,19 +340,29 @@ class TradingSystemWrapper:
         if not self.executable.exists():
             raise FileNotFoundError(f"C++ executable not found at {self.executable}")
 
+        # Long-lived engine for persistent runs, started on first use
+        self._server = None
+        self._server_output = None
+        self._server_lock = threading.Lock()
+
     def run_simulation(self,
                       duration: int = 15,
                       symbols: str = "AAPL,MSFT,GOOGL,TSLA",
                       tick_rate: int = 1000,
-                      zscore_threshold: float = 2.5) -> Dict[str, Any]:
+                      zscore_threshold: float = 2.5,
+                      keep_output: bool = False) -> Dict[str, Any]:
         """
         Run the C++ trading system simulation
 
+        Output is parsed as the engine writes it, so memory use stays flat
+        regardless of how long the simulation runs.
+
         Args:
             duration: Simulation duration in seconds
             symbols: Comma-separated list of symbols
             tick_rate: Ticks per second
             zscore_threshold: Z-score threshold for signals
+            keep_output: Also return the full terminal output as 'raw_output'
 
         Returns:
             Dictionary with simulation results
@@ -48,9 +373,52 @@ class TradingSystemWrapper:
         print(f"   Tick Rate: {tick_rate} Hz")
         print(f"   Z-Score Threshold: {zscore_threshold}")
 
+        stream = self.run_simulation_streaming(duration, symbols, tick_rate, zscore_threshold)
+        output_lines = [] if keep_output else None
+
+        while True:
+            try:
+                lines = next(stream)
+            except StopIteration as stop:
+                result = stop.value
+                break
+            if output_lines is not None:
+                output_lines.extend(lines)
+
+        if result['success']:
+            result['raw_output'] = ''.join(output_lines) if output_lines is not None else None
+        return result
+
+    def run_simulation_streaming(self,
+                                 duration: int = 15,
+                                 symbols: str = "AAPL,MSFT,GOOGL,TSLA",
+                                 tick_rate: int = 1000,
+                                 zscore_threshold: float = 2.5,
+                                 poll_interval: float = 0.2,
+                                 load_csv: bool = True,
+                                 persistent: bool = False):
+        """
+        Run the C++ trading system simulation, yielding output as it arrives
+
+        Each step yields the list of complete output lines received since the
+        previous one, waiting at most poll_interval for new output (so the
+        list may be empty). When the run ends the generator returns the same
+        result dictionary as run_simulation, available as StopIteration.value.
+        Closing the generator early kills the engine.
+
+        Args:
+            duration: Simulation duration in seconds
+            symbols: Comma-separated list of symbols
+            tick_rate: Ticks per second
+            zscore_threshold: Z-score threshold for signals
+            poll_interval: Longest wait for output per step; 0 never blocks
+            load_csv: Load the exported CSV files into the result
+            persistent: Run on a long-lived engine (--serve) kept by this
+                wrapper, started on first use. If another run is using it,
+                this one gets its own process instead.
+        """
         # Clean up old data files
-        for file in self.data_dir.glob("*.csv"):
-            file.unlink()
+        clear_csv_files(self.data_dir)
 
         # Build command
         cmd = [
@@ -61,28 +429,99 @@ class TradingSystemWrapper:
         ]
 
         start_time = time.time()
+        deadline = start_time + duration + 10  # Add buffer time
+        use_server = persistent and self._server_lock.acquire(blocking=False)
+        process = None
+        completed = False
 
         try:
-            # Run the C++ executable
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=duration + 10  # Add buffer time
-            )
+            if use_server:
+                process, chunks, reader = self._ensure_server()
+                request = {"cmd": "run", "duration": duration,
+                           "rate": tick_rate, "zscore": zscore_threshold}
+                process.stdin.write(json.dumps(request).encode() + b'\n')
+                process.stdin.flush()
+            else:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=PIPE_BUFFER_SIZE
+                )
 
-            execution_time = time.time() - start_time
+                # A reader thread keeps the pipe drained even between steps
+                chunks = queue.Queue()
+                reader = threading.Thread(
+                    target=self._forward_output,
+                    args=(process.stdout, chunks)
+                )
+                reader.daemon = True
+                reader.start()
+
+            metrics = {}
+            recent_lines = deque(maxlen=20)  # for the error message on failure
+            partial = b''
+            reply = None
 
-            if result.returncode != 0:
-                raise RuntimeError(f"C++ simulation failed: {result.stderr}")
+            while True:
+                received = []
+                try:
+                    received.append(chunks.get(timeout=poll_interval))
+                    size = len(received[0])
+                    while size < MAX_BYTES_PER_STEP:
+                        received.append(chunks.get_nowait())
+                        size += len(received[-1])
+                except queue.Empty:
+                    pass
+                finished = not reader.is_alive() and chunks.empty()
 
-            # Parse the output for performance metrics
-            output_lines = result.stdout.split('\n')
-            metrics = self._parse_output(output_lines)
+                # Decode all complete lines at once; a trailing partial line waits
+                # for the next step. Newlines never occur inside UTF-8 sequences.
+                data = partial + b''.join(received)
+                if use_server:
+                    # The server ends each run with a one-line JSON reply
+                    reply_start = _find_serve_reply(data)
+                    reply_end = data.find(b'\n', reply_start) if reply_start >= 0 else -1
+                    if reply_end >= 0:
+                        reply = json.loads(data[reply_start:reply_end])
+                        data = data[:reply_start]
+                        finished = True
+                cut = len(data) if finished else data.rfind(b'\n') + 1
+                complete, partial = data[:cut], data[cut:]
 
-            # Load generated CSV files
-            signals_df = self._load_signals()
-            latency_df = self._load_latency_histogram()
+                update_metrics_from_bytes(complete, metrics)
+                lines = complete.decode('utf-8', errors='replace').splitlines(keepends=True)
+                recent_lines.extend(lines)
+                yield lines
+
+                if finished:
+                    break
+                if time.time() > deadline:
+                    raise subprocess.TimeoutExpired(cmd, duration + 10)
+
+            if use_server:
+                if reply is None:
+                    raise RuntimeError(f"C++ engine exited mid-run: {''.join(recent_lines)}")
+                # Any reply ends the round trip, so the server stays usable even
+                # when it rejected the request
+                completed = True
+                if 'error' in reply:
+                    raise RuntimeError(f"C++ engine rejected the run: {reply['error']}")
+                metrics.update(reply['result'])
+            else:
+                returncode = process.wait()
+                if returncode != 0:
+                    raise RuntimeError(f"C++ simulation failed: {''.join(recent_lines)}")
+            completed = True
+            execution_time = time.time() - start_time
+
+            signals_df = latency_df = None
+            if load_csv:
+                # Load generated CSV files; pyarrow releases the GIL while parsing
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    signals_future = executor.submit(self._load_signals)
+                    latency_future = executor.submit(self._load_latency_histogram)
+                    signals_df, latency_df = signals_future.result(), latency_future.result()
 
             return {
                 'success': True,
@@ -90,7 +529,8 @@ class TradingSystemWrapper:
                 'metrics': metrics,
                 'signals': signals_df,
                 'latency_histogram': latency_df,
-                'raw_output': result.stdout,
+                'signals_path': self.signals_path,
+                'latency_path': self.latency_path,
                 'config': {
                     'duration': duration,
                     'symbols': symbols.split(','),
@@ -111,37 +551,64 @@ class TradingSystemWrapper:
                 'error': str(e),
                 'execution_time': time.time() - start_time
             }
+        finally:
+            # Covers timeouts, errors and the caller closing the generator early
+            if use_server:
+                # A server cut off mid-run is replaced on next use
+                if not completed:
+                    self.stop_server()
+                self._server_lock.release()
+            elif process is not None and process.poll() is None:
+                process.kill()
+                process.wait()
 
-    def _parse_output(self, lines) -> Dict[str, Any]:
-        """Parse C++ output for key metrics"""
-        metrics = {}
+    def _ensure_server(self):
+        """Start the --serve engine unless it's already running"""
+        if self._server is None or self._server.poll() is not None:
+            process = subprocess.Popen(
+                [str(self.executable), "--serve"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=PIPE_BUFFER_SIZE
+            )
+            chunks = queue.Queue()
+            reader = threading.Thread(
+                target=self._forward_output,
+                args=(process.stdout, chunks)
+            )
+            reader.daemon = True
+            reader.start()
+            self._server = process
+            self._server_output = (chunks, reader)
+        return (self._server, *self._server_output)
 
-        for line in lines:
-            if "Total Ticks Processed:" in line:
-                metrics['total_ticks'] = int(line.split(':')[1].strip())
-            elif "Total Signals:" in line:
-                metrics['total_signals'] = int(line.split(':')[1].strip())
-            elif "Average Rate:" in line:
-                rate_str = line.split(':')[1].strip().replace(" TPS", "")
-                metrics['average_rate'] = float(rate_str)
-            elif "Queue Drop Rate:" in line:
-                drop_str = line.split(':')[1].strip().replace("%", "")
-                metrics['drop_rate'] = float(drop_str)
+    def stop_server(self) -> None:
+        """Kill the persistent engine, if one is running"""
+        if self._server is not None and self._server.poll() is None:
+            self._server.kill()
+            self._server.wait()
+        self._server = None
+        self._server_output = None
 
-        return metrics
+    @staticmethod
+    def _forward_output(stream, chunks) -> None:
+        """Forward raw output to the queue as it arrives, until EOF"""
+        # read1 returns whatever is buffered (up to the chunk size) without
+        # waiting for more, so output stays live while syscalls stay few
+        for chunk in iter(lambda: stream.read1(READ_CHUNK_SIZE), b''):
+            chunks.put(chunk)
 
     def _load_signals(self) -> Optional[pd.DataFrame]:
         """Load signals CSV file"""
-        signals_file = self.data_dir / "signals.csv"
-        if signals_file.exists():
-            return pd.read_csv(signals_file)
+        if self.signals_path.exists():
+            return read_signals_csv(self.signals_path)
         return None
 
     def _load_latency_histogram(self) -> Optional[pd.DataFrame]:
         """Load latency histogram CSV file"""
-        latency_file = self.data_dir / "latency_histogram.csv"
-        if latency_file.exists():
-            return pd.read_csv(latency_file)
+        if self.latency_path.exists():
+            return read_latency_csv(self.latency_path)
         return None
 
     def get_system_info(self) -> Dict[str, str]:
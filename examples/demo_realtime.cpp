@@ -14,12 +14,16 @@
 #include <vector>
 #include <sstream>
 #include <mutex>
+#include <optional>
+#include <string>
 
-// Global shutdown signal
+// Global shutdown signal: g_running stops the current run, g_shutdown the process
 std::atomic<bool> g_running{true};
+std::atomic<bool> g_shutdown{false};
 
 void signal_handler(int signal) {
     std::cout << "\nReceived signal " << signal << ", shutting down gracefully...\n";
+    g_shutdown.store(true, std::memory_order_release);
     g_running.store(false, std::memory_order_release);
 }
 
@@ -35,6 +39,14 @@ struct DemoConfig {
     bool enable_live_display = true;
 };
 
+// Final statistics of one simulation run
+struct RunSummary {
+    uint64_t total_ticks;
+    uint64_t total_signals;
+    double average_rate;
+    double drop_rate;
+};
+
 // Signal event logger
 class SignalLogger {
 private:
@@ -42,7 +54,13 @@ private:
     std::mutex events_mutex_;
     std::atomic<uint64_t> signal_count_{0};
 
+    // Runs log tens of thousands of signals per second; start with room
+    // for the first burst instead of regrowing from empty under the lock
+    static constexpr std::size_t INITIAL_CAPACITY = 64 * 1024;
+
 public:
+    SignalLogger() { events_.reserve(INITIAL_CAPACITY); }
+
     void log_signal(const SignalEvent& event) {
         signal_count_.fetch_add(1, std::memory_order_relaxed);
 
@@ -166,37 +184,8 @@ public:
     }
 };
 
-int main(int argc, char* argv[]) {
-    // Setup signal handling
-    std::signal(SIGINT, signal_handler);
-    std::signal(SIGTERM, signal_handler);
-
-    // Configuration
-    DemoConfig config;
-
-    // Parse command line arguments (simplified)
-    for (int i = 1; i < argc; ++i) {
-        std::string arg = argv[i];
-        if (arg == "--help") {
-            std::cout << "Usage: " << argv[0] << " [options]\n"
-                      << "Options:\n"
-                      << "  --duration N     Run for N seconds (default: 30)\n"
-                      << "  --rate N         Tick rate in Hz (default: 2000)\n"
-                      << "  --zscore N       Z-score threshold (default: 2.5)\n"
-                      << "  --help           Show this help\n";
-            return 0;
-        } else if (arg == "--duration" && i + 1 < argc) {
-            config.duration = std::chrono::seconds(std::stoi(argv[++i]));
-        } else if (arg == "--rate" && i + 1 < argc) {
-            config.tick_rate_ms = 1000.0 / std::stod(argv[++i]);
-        } else if (arg == "--zscore" && i + 1 < argc) {
-            config.zscore_threshold = std::stod(argv[++i]);
-        }
-    }
-
-    std::cout << "🚀 Starting Real-Time Trading System Demo...\n";
-    std::cout << "Press Ctrl+C to stop gracefully\n\n";
-
+// Run one simulation with the given configuration, exporting its CSV files
+RunSummary run_simulation(const DemoConfig& config) {
     // Initialize components
     SPSCQueue<Tick, 65536> tick_queue;  // 64K tick buffer
     SignalLogger signal_logger;
@@ -282,12 +271,18 @@ int main(int argc, char* argv[]) {
     std::cout << "╠══════════════════════════════════════════════════════════════╣\n";
 
     const auto& latency_hist = router.latency_histogram();
-    std::cout << "║ Total Ticks Processed: " << std::setw(10) << router.ticks_processed() << "                    ║\n";
-    std::cout << "║ Total Signals:         " << std::setw(10) << signal_logger.signal_count() << "                    ║\n";
+    const RunSummary summary{
+        router.ticks_processed(),
+        signal_logger.signal_count(),
+        router.processing_rate(),
+        feed_sim.drop_rate() * 100.0
+    };
+    std::cout << "║ Total Ticks Processed: " << std::setw(10) << summary.total_ticks << "                    ║\n";
+    std::cout << "║ Total Signals:         " << std::setw(10) << summary.total_signals << "                    ║\n";
     std::cout << "║ Average Rate:           " << std::setw(8) << std::fixed << std::setprecision(0)
-              << router.processing_rate() << " TPS               ║\n";
+              << summary.average_rate << " TPS               ║\n";
     std::cout << "║ Queue Drop Rate:        " << std::setw(8) << std::fixed << std::setprecision(2)
-              << feed_sim.drop_rate() * 100.0 << "%                 ║\n";
+              << summary.drop_rate << "%                 ║\n";
     std::cout << "╚══════════════════════════════════════════════════════════════╝\n";
 
     // Print latency histogram
@@ -310,6 +305,113 @@ int main(int argc, char* argv[]) {
         std::cout << "✅ Data exported to data/ directory\n";
     }
 
+    return summary;
+}
+
+// Value of a top-level field in the flat JSON objects --serve reads, if present
+std::optional<std::string> json_field(const std::string& line, const std::string& key) {
+    const auto key_pos = line.find("\"" + key + "\"");
+    if (key_pos == std::string::npos) return std::nullopt;
+
+    auto pos = line.find(':', key_pos + key.size() + 2);
+    if (pos == std::string::npos) return std::nullopt;
+    pos = line.find_first_not_of(" \t", pos + 1);
+    if (pos == std::string::npos) return std::nullopt;
+
+    if (line[pos] == '"') {
+        const auto end = line.find('"', pos + 1);
+        if (end == std::string::npos) return std::nullopt;
+        return line.substr(pos + 1, end - pos - 1);
+    }
+    const auto end = line.find_first_of(",} \t", pos);
+    return line.substr(pos, end == std::string::npos ? std::string::npos : end - pos);
+}
+
+// Serve runs over stdin/stdout, one JSON object per line, until stdin closes:
+//   -> {"cmd": "run", "duration": 15, "rate": 1000, "zscore": 2.5}
+//   <- the usual run output, then {"result": {"total_ticks": ..., ...}}
+// A long-lived engine skips process startup and warmup on every run.
+int serve(const DemoConfig& defaults) {
+    std::string line;
+    while (!g_shutdown.load(std::memory_order_acquire) && std::getline(std::cin, line)) {
+        if (line.empty()) continue;
+
+        const auto cmd = json_field(line, "cmd");
+        if (cmd == "quit") break;
+        if (cmd != "run") {
+            std::cout << "{\"error\": \"unknown command\"}" << std::endl;
+            continue;
+        }
+
+        DemoConfig config = defaults;
+        try {
+            if (const auto duration = json_field(line, "duration")) {
+                config.duration = std::chrono::seconds(std::stoi(*duration));
+            }
+            if (const auto rate = json_field(line, "rate")) {
+                config.tick_rate_ms = 1000.0 / std::stod(*rate);
+            }
+            if (const auto zscore = json_field(line, "zscore")) {
+                config.zscore_threshold = std::stod(*zscore);
+            }
+        } catch (const std::exception&) {
+            std::cout << "{\"error\": \"invalid run parameters\"}" << std::endl;
+            continue;
+        }
+
+        g_running.store(true, std::memory_order_release);
+        const auto summary = run_simulation(config);
+
+        std::cout << "{\"result\": {\"total_ticks\": " << summary.total_ticks
+                  << ", \"total_signals\": " << summary.total_signals
+                  << ", \"average_rate\": " << std::fixed << std::setprecision(0) << summary.average_rate
+                  << ", \"drop_rate\": " << std::setprecision(2) << summary.drop_rate
+                  << "}}" << std::endl;
+    }
+    return 0;
+}
+
+int main(int argc, char* argv[]) {
+    // Setup signal handling
+    std::signal(SIGINT, signal_handler);
+    std::signal(SIGTERM, signal_handler);
+
+    // Configuration
+    DemoConfig config;
+    bool serve_mode = false;
+
+    // Parse command line arguments (simplified)
+    for (int i = 1; i < argc; ++i) {
+        std::string arg = argv[i];
+        if (arg == "--help") {
+            std::cout << "Usage: " << argv[0] << " [options]\n"
+                      << "Options:\n"
+                      << "  --duration N     Run for N seconds (default: 30)\n"
+                      << "  --rate N         Tick rate in Hz (default: 2000)\n"
+                      << "  --zscore N       Z-score threshold (default: 2.5)\n"
+                      << "  --serve          Take runs as JSON lines on stdin\n"
+                      << "  --help           Show this help\n";
+            return 0;
+        } else if (arg == "--duration" && i + 1 < argc) {
+            config.duration = std::chrono::seconds(std::stoi(argv[++i]));
+        } else if (arg == "--rate" && i + 1 < argc) {
+            config.tick_rate_ms = 1000.0 / std::stod(argv[++i]);
+        } else if (arg == "--zscore" && i + 1 < argc) {
+            config.zscore_threshold = std::stod(argv[++i]);
+        } else if (arg == "--serve") {
+            serve_mode = true;
+        }
+    }
+
+    if (serve_mode) {
+        return serve(config);
+    }
+
+    std::cout << "🚀 Starting Real-Time Trading System Demo...\n";
+    std::cout << "Press Ctrl+C to stop gracefully\n\n";
+
+    run_simulation(config);
+
     std::cout << "\n🎉 Demo completed successfully!\n";
     return 0;
 }
\ No newline at end of file
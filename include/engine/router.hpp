@@ -7,6 +7,7 @@
 #include <memory>
 #include <functional>
 #include <string>
+#include <string_view>
 
 // Callback for signal events
 using SignalCallback = std::function<void(const SignalEvent&)>;
@@ -14,19 +15,37 @@ using SignalCallback = std::function<void(const SignalEvent&)>;
 // Main routing and signal detection engine
 class Router {
 private:
-    // Per-symbol signal rules
-    std::unordered_map<std::string, std::unique_ptr<ZScoreRule>> zscore_rules_;
-    std::unordered_map<std::string, std::unique_ptr<VolumeRule>> volume_rules_;
+    // Per-symbol signal rules, kept together so a tick finds all of them
+    // with a single lookup
+    struct SymbolRules {
+        ZScoreRule zscore;
+        VolumeRule volume;
+        MeanReversionRule mean_reversion;
+
+        SymbolRules(double zscore_threshold, double volume_threshold) noexcept
+            : zscore(zscore_threshold)
+            , volume(volume_threshold) {}
+    };
+    std::unordered_map<std::string_view, SymbolRules> symbol_rules_;
 
     // Cross-symbol rules (pairs trading)
     std::unordered_map<std::string, std::unique_ptr<CorrelationBreakRule>> correlation_rules_;
-    std::unordered_map<std::string, std::unique_ptr<MeanReversionRule>> mean_reversion_rules_;
 
     // Symbol pair mappings for correlation analysis
-    std::vector<std::pair<std::string, std::string>> watched_pairs_;
+    struct WatchedPair {
+        std::string_view symbol1;
+        std::string_view symbol2;
+        CorrelationBreakRule* rule;  // Owned by correlation_rules_
+    };
+    std::vector<WatchedPair> watched_pairs_;
 
-    // Latest tick data for each symbol
-    std::unordered_map<std::string, Tick> latest_ticks_;
+    // Indices into watched_pairs_ for each symbol, built when pairs are added
+    // so ticks only visit the pairs they belong to
+    std::unordered_map<std::string_view, std::vector<std::size_t>> pairs_by_symbol_;
+
+    // Latest tick data for each symbol. All per-symbol maps are keyed by
+    // views into the SymbolTable pool, so ticks never build a std::string.
+    std::unordered_map<std::string_view, Tick> latest_ticks_;
 
     // Signal generation
     SignalCallback signal_callback_;
@@ -63,29 +82,42 @@ public:
 
     void add_watched_pair(const std::string& symbol1, const std::string& symbol2) {
         const std::string pair_key = make_pair_key(symbol1, symbol2);
-        watched_pairs_.emplace_back(symbol1, symbol2);
+        auto& rule = correlation_rules_[pair_key];
+        if (rule) return;  // Already watched
 
         // Initialize correlation rule for this pair
-        correlation_rules_[pair_key] = std::make_unique<CorrelationBreakRule>(
-            correlation_threshold_, 50);
+        rule = std::make_unique<CorrelationBreakRule>(correlation_threshold_, 50);
+
+        const std::string_view interned1 = SymbolTable::intern(symbol1);
+        const std::string_view interned2 = SymbolTable::intern(symbol2);
+
+        const std::size_t index = watched_pairs_.size();
+        watched_pairs_.push_back(WatchedPair{interned1, interned2, rule.get()});
+        pairs_by_symbol_[interned1].push_back(index);
+        if (interned2 != interned1) {
+            pairs_by_symbol_[interned2].push_back(index);
+        }
     }
 
     // Main tick processing function
     void process_tick(const Tick& tick) {
         const auto start_time = std::chrono::steady_clock::now();
 
-        // Update latest tick data
-        const std::string symbol{tick.symbol};
-        latest_ticks_[symbol] = tick;
-
-        // Ensure rules exist for this symbol
-        ensure_rules_exist(symbol);
+        // Update latest tick data; the stored key is the interned symbol
+        auto latest_it = latest_ticks_.find(tick.symbol);
+        if (latest_it == latest_ticks_.end()) {
+            latest_it = latest_ticks_.emplace(
+                SymbolTable::intern(std::string{tick.symbol}), tick).first;
+        } else {
+            latest_it->second = tick;
+        }
+        const std::string_view symbol = latest_it->first;
 
-        // Process single-symbol signals
-        process_single_symbol_signals(tick);
+        // Process single-symbol signals, creating the rules on first sight
+        process_single_symbol_signals(tick, symbol, rules_for(symbol));
 
         // Process cross-symbol signals
-        process_cross_symbol_signals(tick);
+        process_cross_symbol_signals(symbol);
 
         // Update latency statistics
         latency_hist_.add_sample(tick.timestamp, start_time);
@@ -117,18 +149,14 @@ public:
         latency_hist_.reset();
 
         // Reset all rules
-        for (auto& [symbol, rule] : zscore_rules_) {
-            rule->reset();
-        }
-        for (auto& [symbol, rule] : volume_rules_) {
-            rule->reset();
+        for (auto& [symbol, rules] : symbol_rules_) {
+            rules.zscore.reset();
+            rules.volume.reset();
+            rules.mean_reversion.reset();
         }
         for (auto& [pair, rule] : correlation_rules_) {
             rule->reset();
         }
-        for (auto& [symbol, rule] : mean_reversion_rules_) {
-            rule->reset();
-        }
     }
 
     // Get current correlation for a pair
@@ -140,60 +168,53 @@ public:
     }
 
 private:
-    void ensure_rules_exist(const std::string& symbol) {
-        if (zscore_rules_.find(symbol) == zscore_rules_.end()) {
-            zscore_rules_[symbol] = std::make_unique<ZScoreRule>(zscore_threshold_);
-        }
-        if (volume_rules_.find(symbol) == volume_rules_.end()) {
-            volume_rules_[symbol] = std::make_unique<VolumeRule>(volume_threshold_);
-        }
-        if (mean_reversion_rules_.find(symbol) == mean_reversion_rules_.end()) {
-            mean_reversion_rules_[symbol] = std::make_unique<MeanReversionRule>();
-        }
+    SymbolRules& rules_for(std::string_view symbol) {
+        return symbol_rules_.try_emplace(
+            symbol, zscore_threshold_, volume_threshold_).first->second;
     }
 
-    void process_single_symbol_signals(const Tick& tick) {
-        const std::string symbol{tick.symbol};
-
+    void process_single_symbol_signals(const Tick& tick, std::string_view symbol,
+                                       SymbolRules& rules) {
         // Z-Score analysis on last price
-        auto& zscore_rule = zscore_rules_[symbol];
-        zscore_rule->add_observation(tick.last_price);
+        auto& zscore_rule = rules.zscore;
+        zscore_rule.add_observation(tick.last_price);
 
         double zscore_strength;
-        if (zscore_rule->evaluate(zscore_strength)) {
-            emit_signal(SignalEvent::Type::Z_SCORE_BREAK, symbol, "",
+        if (zscore_rule.evaluate(zscore_strength)) {
+            emit_signal(SignalEvent::Type::Z_SCORE_BREAK, symbol, {},
                        zscore_strength, 0.95);
         }
 
         // Volume spike analysis
-        auto& volume_rule = volume_rules_[symbol];
-        volume_rule->add_volume(tick.last_size);
+        auto& volume_rule = rules.volume;
+        volume_rule.add_volume(tick.last_size);
 
         double volume_strength;
-        if (volume_rule->evaluate(volume_strength)) {
-            emit_signal(SignalEvent::Type::VOLUME_SPIKE, symbol, "",
+        if (volume_rule.evaluate(volume_strength)) {
+            emit_signal(SignalEvent::Type::VOLUME_SPIKE, symbol, {},
                        volume_strength, 0.90);
         }
 
         // Mean reversion analysis
-        auto& mean_rev_rule = mean_reversion_rules_[symbol];
-        mean_rev_rule->add_observation(tick.last_price);
+        auto& mean_rev_rule = rules.mean_reversion;
+        mean_rev_rule.add_observation(tick.last_price);
 
         double mean_rev_strength;
-        if (mean_rev_rule->evaluate(mean_rev_strength)) {
-            emit_signal(SignalEvent::Type::PAIR_TRADE_ENTRY, symbol, "",
+        if (mean_rev_rule.evaluate(mean_rev_strength)) {
+            emit_signal(SignalEvent::Type::PAIR_TRADE_ENTRY, symbol, {},
                        mean_rev_strength, 0.85);
         }
     }
 
-    void process_cross_symbol_signals(const Tick& tick) {
-        const std::string current_symbol{tick.symbol};
+    void process_cross_symbol_signals(std::string_view current_symbol) {
+        // Visit only the pairs involving this symbol
+        const auto pairs_it = pairs_by_symbol_.find(current_symbol);
+        if (pairs_it == pairs_by_symbol_.end()) {
+            return;
+        }
 
-        // Check all pairs involving this symbol
-        for (const auto& [symbol1, symbol2] : watched_pairs_) {
-            if (symbol1 != current_symbol && symbol2 != current_symbol) {
-                continue;
-            }
+        for (const std::size_t index : pairs_it->second) {
+            const auto& [symbol1, symbol2, corr_rule] = watched_pairs_[index];
 
             // Check if we have recent data for both symbols
             auto it1 = latest_ticks_.find(symbol1);
@@ -203,9 +224,6 @@ private:
                 continue;
             }
 
-            const std::string pair_key = make_pair_key(symbol1, symbol2);
-            auto& corr_rule = correlation_rules_[pair_key];
-
             // Add the pair observation
             corr_rule->add_pair(it1->second.last_price, it2->second.last_price);
 
@@ -218,14 +236,15 @@ private:
         }
     }
 
-    void emit_signal(SignalEvent::Type type, const std::string& primary,
-                    const std::string& secondary, double strength, double confidence) {
+    // primary and secondary must be interned views (or empty)
+    void emit_signal(SignalEvent::Type type, std::string_view primary,
+                    std::string_view secondary, double strength, double confidence) {
         if (!signal_callback_) return;
 
         SignalEvent event{
             type,
-            SymbolTable::intern(primary),
-            secondary.empty() ? std::string_view{} : SymbolTable::intern(secondary),
+            primary,
+            secondary,
             strength,
             confidence
         };
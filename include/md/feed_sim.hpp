@@ -8,6 +8,8 @@
 #include <atomic>
 #include <thread>
 #include <algorithm>
+#include <cmath>
+#include <string_view>
 
 enum class PriceModel {
     GEOMETRIC_BROWNIAN_MOTION,
@@ -39,6 +41,7 @@ private:
     std::vector<SymbolConfig> symbols_;
     std::vector<double> current_prices_;
     std::vector<uint64_t> sequence_ids_;
+    std::vector<std::string_view> interned_symbols_;  // Interned once, reused per tick
 
     // Random number generation
     mutable std::mt19937_64 rng_;
@@ -49,6 +52,8 @@ private:
     // Simulation parameters
     PriceModel model_{PriceModel::GEOMETRIC_BROWNIAN_MOTION};
     double time_step_ms_{1.0};  // Time between ticks in milliseconds
+    double dt_{0.0};            // Time step in years
+    double sqrt_dt_{0.0};
     std::atomic<uint64_t> global_sequence_{0};
 
     // Performance tracking
@@ -64,11 +69,15 @@ public:
         , sequence_ids_(symbols_.size(), 0)
         , rng_(std::random_device{}())
         , model_(model)
-        , time_step_ms_(tick_interval_ms) {
+        , time_step_ms_(tick_interval_ms)
+        , dt_(tick_interval_ms / (365.25 * 24 * 60 * 60 * 1000))
+        , sqrt_dt_(std::sqrt(dt_)) {
 
-        // Initialize current prices
+        // Initialize current prices and intern symbols up front
+        interned_symbols_.reserve(symbols_.size());
         for (size_t i = 0; i < symbols_.size(); ++i) {
             current_prices_[i] = symbols_[i].initial_price;
+            interned_symbols_.push_back(SymbolTable::intern(symbols_[i].symbol));
         }
     }
 
@@ -158,24 +167,26 @@ private:
         const double volume = generate_volume();
 
         return Tick{
-            SymbolTable::intern(config.symbol),
+            interned_symbols_[symbol_idx],
             price,
             bid,
             ask,
             volume,
-            ++sequence_ids_[symbol_idx]
+            ++sequence_ids_[symbol_idx],
+            timestamp
         };
     }
 
     void update_price(double& price, const SymbolConfig& config) {
-        const double dt = time_step_ms_ / (365.25 * 24 * 60 * 60 * 1000); // Convert to years
+        const double dt = dt_;
+        const double sqrt_dt = sqrt_dt_;
         const double z = normal_dist_(rng_);
 
         switch (model_) {
             case PriceModel::GEOMETRIC_BROWNIAN_MOTION: {
                 // dS = μS dt + σS dW
                 const double drift_term = config.drift * price * dt;
-                const double diffusion_term = config.volatility * price * std::sqrt(dt) * z;
+                const double diffusion_term = config.volatility * price * sqrt_dt * z;
                 price += drift_term + diffusion_term;
                 break;
             }
@@ -184,7 +195,7 @@ private:
                 // dS = θ(μ - S) dt + σ dW
                 const double mean_rev_term = config.mean_reversion *
                     (config.initial_price - price) * dt;
-                const double diffusion_term = config.volatility * std::sqrt(dt) * z;
+                const double diffusion_term = config.volatility * sqrt_dt * z;
                 price += mean_rev_term + diffusion_term;
                 break;
             }
@@ -192,7 +203,7 @@ private:
             case PriceModel::JUMP_DIFFUSION: {
                 // GBM + Poisson jumps
                 const double drift_term = config.drift * price * dt;
-                const double diffusion_term = config.volatility * price * std::sqrt(dt) * z;
+                const double diffusion_term = config.volatility * price * sqrt_dt * z;
                 price += drift_term + diffusion_term;
 
                 // Add jumps
@@ -209,7 +220,7 @@ private:
 
             case PriceModel::MICROSTRUCTURE_NOISE: {
                 // High-frequency noise model
-                const double base_move = config.volatility * std::sqrt(dt) * z * price;
+                const double base_move = config.volatility * sqrt_dt * z * price;
                 const double noise = config.tick_size * normal_dist_(rng_) * 0.1;
                 price += base_move + noise;
                 break;
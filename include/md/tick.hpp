@@ -76,6 +76,19 @@ struct alignas(64) Tick {
         , symbol(sym)
         , sequence_id(seq) {}
 
+    // Constructor with a caller-supplied timestamp, so a batch of ticks
+    // can share one clock read
+    Tick(std::string_view sym, double last, double bid, double ask,
+         double size, uint64_t seq,
+         std::chrono::steady_clock::time_point ts) noexcept
+        : last_price(last)
+        , bid_price(bid)
+        , ask_price(ask)
+        , last_size(size)
+        , timestamp(ts)
+        , symbol(sym)
+        , sequence_id(seq) {}
+
     // Move constructor and assignment (efficient)
     Tick(Tick&&) noexcept = default;
     Tick& operator=(Tick&&) noexcept = default;
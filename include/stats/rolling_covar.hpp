@@ -73,14 +73,11 @@ public:
         return std::sqrt(variance_y());
     }
 
-    // Correlation coefficient
+    // Correlation coefficient (the n-1 normalisers cancel, so use the comoments)
     [[nodiscard]] double correlation() const noexcept {
-        const double var_x = variance_x();
-        const double var_y = variance_y();
-
-        if (var_x <= 0.0 || var_y <= 0.0) return 0.0;
+        if (count_ < 2 || m2_x_ <= 0.0 || m2_y_ <= 0.0) return 0.0;
 
-        return covariance() / std::sqrt(var_x * var_y);
+        return c_ / std::sqrt(m2_x_ * m2_y_);
     }
 
     // Beta coefficient (slope of regression y on x)
@@ -126,57 +126,44 @@ private:
     double buffer_[WindowSize];
     std::size_t index_{0};
     std::size_t count_{0};
-    double sum_{0.0};
-    double sum_sq_{0.0};
-
-    void update_sums() noexcept {
-        sum_ = 0.0;
-        sum_sq_ = 0.0;
-        const std::size_t n = std::min(count_, WindowSize);
-        for (std::size_t i = 0; i < n; ++i) {
-            const double val = buffer_[i];
-            sum_ += val;
-            sum_sq_ += val * val;
-        }
-    }
+    double mean_{0.0};
+    double m2_{0.0};    // Sum of squared deviations over the window
 
 public:
     WindowedStats() { std::fill(buffer_, buffer_ + WindowSize, 0.0); }
 
+    // Welford update; once the window is full the evicted sample's
+    // contribution is swapped out in the same step (West's algorithm)
     void add(double value) noexcept {
         if (count_ >= WindowSize) {
-            // Remove old value from sums
             const double old_val = buffer_[index_];
-            sum_ -= old_val;
-            sum_sq_ -= old_val * old_val;
+            const double old_mean = mean_;
+            mean_ += (value - old_val) / static_cast<double>(WindowSize);
+            m2_ += (value - old_val) * (value - mean_ + old_val - old_mean);
+            m2_ = std::max(m2_, 0.0);
+        } else {
+            count_++;
+            const double delta = value - mean_;
+            mean_ += delta / static_cast<double>(count_);
+            m2_ += delta * (value - mean_);
         }
 
-        // Add new value
         buffer_[index_] = value;
-        sum_ += value;
-        sum_sq_ += value * value;
-
         index_ = (index_ + 1) % WindowSize;
-        if (count_ < WindowSize) count_++;
     }
 
     void reset() noexcept {
         std::fill(buffer_, buffer_ + WindowSize, 0.0);
         index_ = 0;
         count_ = 0;
-        sum_ = 0.0;
-        sum_sq_ = 0.0;
+        mean_ = 0.0;
+        m2_ = 0.0;
     }
 
-    [[nodiscard]] double mean() const noexcept {
-        return count_ > 0 ? sum_ / static_cast<double>(count_) : 0.0;
-    }
+    [[nodiscard]] double mean() const noexcept { return mean_; }
 
     [[nodiscard]] double variance() const noexcept {
-        if (count_ <= 1) return 0.0;
-        const double n = static_cast<double>(count_);
-        const double mean_val = mean();
-        return (sum_sq_ - n * mean_val * mean_val) / (n - 1.0);
+        return count_ > 1 ? m2_ / static_cast<double>(count_ - 1) : 0.0;
     }
 
     [[nodiscard]] double std_dev() const noexcept {
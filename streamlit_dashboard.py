@@ -5,15 +5,33 @@ Perfect for showcasing to recruiters with LIVE terminal output!
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import subprocess
-import threading
-import queue
+import html
 import time
-from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from cpp_trading_wrapper import (
+    TradingSystemWrapper, latency_percentiles, read_latency_csv, read_signals_csv
+)
+
+# Terminal lines kept for display; older output scrolls off
+MAX_TERMINAL_LINES = 2000
+
+# Signal columns the dashboard actually displays
+SIGNAL_COLUMNS = ['timestamp', 'type', 'primary_symbol', 'signal_strength', 'confidence']
+
+# Points plotted on the signal timeline; longer runs keep each window's extremes
+MAX_TIMELINE_POINTS = 5000
+
+# Entries kept per results cache (CSV loads and figures). Only the latest
+# export is ever shown, but every run writes new files, so uncapped caches
+# would keep every run's data.
+RESULTS_CACHE_ENTRIES = 2
 
 # Page configuration
 st.set_page_config(
@@ -23,8 +41,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Page styles, title and tech badges: static, so built once at import and
+# sent as a single element on every rerun
+HEADER_HTML = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -73,130 +92,131 @@ st.markdown("""
         51%, 100% { opacity: 0; }
     }
 </style>
-""", unsafe_allow_html=True)
+<h1 class="main-header">🚀 C++ Real-Time Trading System</h1>
+<div style="text-align: center; margin-bottom: 2rem;">
+    <span class="tech-badge">C++20</span>
+    <span class="tech-badge">Lock-Free Queues</span>
+    <span class="tech-badge">Real-Time Analytics</span>
+    <span class="tech-badge">Sub-μs Latency</span>
+    <span class="tech-badge">Welford's Algorithm</span>
+</div>
+"""
 
-def stream_process_output(process, output_queue, stop_event):
-    """Stream output from subprocess in real-time"""
-    try:
-        for line in iter(process.stdout.readline, ''):
-            if stop_event.is_set():
-                break
-            output_queue.put(line)
-            if process.poll() is not None:
-                break
-    except Exception as e:
-        output_queue.put(f"Error: {str(e)}\n")
+@st.cache_resource(show_spinner=False)
+def get_wrapper():
+    """One engine wrapper per server; a missing engine raises and isn't cached"""
+    return TradingSystemWrapper()
 
 def run_cpp_simulation(duration, tick_rate, zscore_threshold):
-    """Run C++ simulation with live output streaming"""
-
-    executable = Path("build/demo_realtime")
-    data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
-
-    # Clean old data files
-    for file in data_dir.glob("*.csv"):
-        file.unlink()
-
-    # Build command
-    cmd = [
-        str(executable),
-        "--duration", str(duration),
-        "--rate", str(tick_rate),
-        "--zscore", str(zscore_threshold)
-    ]
-
-    # Create queue for output
-    output_queue = queue.Queue()
-    stop_event = threading.Event()
-
-    # Start process
-    process = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
-        universal_newlines=True
+    """Start a C++ simulation, returning a generator of its live output lines"""
+    # Never block: the live view polls on its own schedule. The dashboard
+    # loads the CSVs itself, through its cache. Runs go to the cached
+    # wrapper's long-lived engine, so clicks don't each spawn a process.
+    return get_wrapper().run_simulation_streaming(
+        duration=duration,
+        tick_rate=tick_rate,
+        zscore_threshold=zscore_threshold,
+        poll_interval=0,
+        load_csv=False,
+        persistent=True
     )
 
-    # Start output streaming thread
-    output_thread = threading.Thread(
-        target=stream_process_output,
-        args=(process, output_queue, stop_event)
-    )
-    output_thread.daemon = True
-    output_thread.start()
-
-    return process, output_queue, stop_event, output_thread
+def _csv_key(path):
+    """Cache key for a CSV that changes whenever the file is rewritten"""
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+@st.cache_data(show_spinner=False, max_entries=RESULTS_CACHE_ENTRIES)
+def _load_signals_cached(path, mtime_ns, size):
+    signals_df = read_signals_csv(path, columns=SIGNAL_COLUMNS)
+    # Convert once here so cache hits never redo it; ticks share many ms values
+    signals_df['timestamp'] = pd.to_datetime(signals_df['timestamp'], unit='ms', cache=True)
+    return signals_df
+
+@st.cache_data(show_spinner=False, max_entries=RESULTS_CACHE_ENTRIES)
+def _load_latency_cached(path, mtime_ns, size):
+    return read_latency_csv(path)
+
+def _wait_for_files(paths, timeout=1.0):
+    """Wait until every path exists and is non-empty, or the timeout passes"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if all(path.exists() and path.stat().st_size > 0 for path in paths):
+            return
+        time.sleep(0.02)
+
+def _load_if_exists(loader, path):
+    """Run a cached CSV loader, returning None if the file is missing or unreadable"""
+    if not path.exists():
+        return None
+    try:
+        return loader(*_csv_key(path))
+    except:
+        return None
 
-def load_results():
+def load_results(signals_path, latency_path):
     """Load CSV results after simulation"""
-    data_dir = Path("data")
-
-    signals_df = None
-    latency_df = None
-
-    signals_file = data_dir / "signals.csv"
-    if signals_file.exists():
-        try:
-            signals_df = pd.read_csv(signals_file)
-        except:
-            pass
-
-    latency_file = data_dir / "latency_histogram.csv"
-    if latency_file.exists():
-        try:
-            latency_df = pd.read_csv(latency_file)
-        except:
-            pass
-
-    return signals_df, latency_df
-
-def parse_metrics_from_output(output_text):
-    """Extract metrics from terminal output"""
-    metrics = {}
-    lines = output_text.split('\n')
-
-    for line in lines:
-        if "Total Ticks Processed:" in line:
-            try:
-                metrics['total_ticks'] = int(line.split(':')[1].strip())
-            except:
-                pass
-        elif "Total Signals:" in line:
-            try:
-                metrics['total_signals'] = int(line.split(':')[1].strip())
-            except:
-                pass
-        elif "Average Rate:" in line:
-            try:
-                rate_str = line.split(':')[1].strip().split()[0]
-                metrics['average_rate'] = float(rate_str)
-            except:
-                pass
-        elif "Queue Drop Rate:" in line:
-            try:
-                drop_str = line.split(':')[1].strip().replace("%", "")
-                metrics['drop_rate'] = float(drop_str)
-            except:
-                pass
-
-    return metrics
+    # Both files are independent, so parse them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        signals_future = executor.submit(
+            _load_if_exists, _load_signals_cached, signals_path
+        )
+        latency_future = executor.submit(
+            _load_if_exists, _load_latency_cached, latency_path
+        )
+        return signals_future.result(), latency_future.result()
+
+@st.fragment(run_every=0.2)
+def live_output_view():
+    """Drain engine output into the terminal view; Streamlit reruns just this every 200 ms"""
+    if not st.session_state.running:
+        return
+
+    output_lines = st.session_state.output_lines
+
+    # Take whatever complete lines arrived since the last run; the generator
+    # returns the run's result once the engine has exited
+    try:
+        new_lines = next(st.session_state.stream)
+        finished = False
+    except StopIteration as stop:
+        st.session_state.result = stop.value
+        new_lines = []
+        finished = True
+
+    # Rebuild the terminal text only when lines were added. The element itself
+    # is still emitted every run, since a fragment drops whatever it skips.
+    # Lines are escaped once as they arrive, never per render.
+    if new_lines or st.session_state.terminal_html is None:
+        output_lines.extend(map(html.escape, new_lines))
+        output_text = "".join(output_lines)
+        st.session_state.terminal_html = f'<pre class="terminal-output">{output_text}</pre>'
+
+    # Display live output in terminal-style; st.html skips markdown parsing
+    st.html(st.session_state.terminal_html)
+
+    # Show elapsed time; the fixed duration rides along as the progress delta
+    # rather than costing a third widget on every refresh
+    duration = st.session_state.run_duration
+    elapsed = time.time() - st.session_state.start_time
+    col1, col2 = st.columns(2)
+    col1.metric("⏱️ Elapsed", f"{elapsed:.1f}s")
+    col2.metric(
+        "📊 Progress",
+        f"{min(100, int(elapsed / duration * 100))}%",
+        delta=f"of {duration}s",
+        delta_color="off"
+    )
+
+    # Once the engine has exited and its output is drained, rerun the whole
+    # app so main() can show the results
+    if finished:
+        st.session_state.running = False
+        st.rerun()
 
 def main():
     # Title and introduction
-    st.markdown('<h1 class="main-header">🚀 C++ Real-Time Trading System</h1>', unsafe_allow_html=True)
-
-    st.markdown("""
-    <div style="text-align: center; margin-bottom: 2rem;">
-        <span class="tech-badge">C++20</span>
-        <span class="tech-badge">Lock-Free Queues</span>
-        <span class="tech-badge">Real-Time Analytics</span>
-        <span class="tech-badge">Sub-μs Latency</span>
-        <span class="tech-badge">Welford's Algorithm</span>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
     # Sidebar for configuration
     st.sidebar.header("🎛️ Simulation Parameters")
@@ -207,11 +227,11 @@ def main():
 
     # System info
     st.sidebar.header("🔧 System Information")
-    executable = Path("build/demo_realtime")
-    if executable.exists():
+    try:
+        system_info = get_wrapper().get_system_info()
         st.sidebar.success("✅ C++ Engine Ready")
-        st.sidebar.code(f"{executable}", language="bash")
-    else:
+        st.sidebar.code(system_info['executable_path'], language="bash")
+    except FileNotFoundError:
         st.sidebar.error("❌ C++ Engine Not Found")
         st.sidebar.text("Run: cmake -S . -B build && cmake --build build")
         return
@@ -260,9 +280,12 @@ def main():
     # Initialize session state
     if 'running' not in st.session_state:
         st.session_state.running = False
-        st.session_state.process = None
-        st.session_state.output_queue = None
-        st.session_state.stop_event = None
+        st.session_state.stream = None
+        st.session_state.result = None
+        st.session_state.output_lines = None
+        st.session_state.terminal_html = None
+        st.session_state.start_time = None
+        st.session_state.run_duration = duration
 
     # Run button
     col_btn1, col_btn2 = st.columns([1, 5])
@@ -271,20 +294,22 @@ def main():
         if not st.session_state.running:
             if st.button("🎬 Run Demo", type="primary", use_container_width=True):
                 st.session_state.running = True
-                process, output_queue, stop_event, thread = run_cpp_simulation(
+                st.session_state.stream = run_cpp_simulation(
                     duration, tick_rate, zscore_threshold
                 )
-                st.session_state.process = process
-                st.session_state.output_queue = output_queue
-                st.session_state.stop_event = stop_event
+                st.session_state.result = None
+                st.session_state.output_lines = deque(maxlen=MAX_TERMINAL_LINES)
+                st.session_state.terminal_html = None
+                st.session_state.start_time = time.time()
+                st.session_state.run_duration = duration
                 st.rerun()
         else:
             if st.button("⏹️ Stop", type="secondary", use_container_width=True):
-                if st.session_state.stop_event:
-                    st.session_state.stop_event.set()
-                if st.session_state.process:
-                    st.session_state.process.terminate()
+                # Closing the generator kills the engine
+                if st.session_state.stream:
+                    st.session_state.stream.close()
                 st.session_state.running = False
+                st.session_state.stream = None
                 st.rerun()
 
     with col_btn2:
@@ -299,68 +324,36 @@ def main():
     # Live output section
     if st.session_state.running:
         st.subheader("📟 Live Terminal Output")
+        live_output_view()
 
-        output_placeholder = st.empty()
-        metrics_placeholder = st.empty()
-
-        output_text = ""
-        start_time = time.time()
-
-        while st.session_state.running:
-            # Check if process is still running
-            if st.session_state.process.poll() is not None:
-                st.session_state.running = False
-                break
-
-            # Get new output lines
-            try:
-                while not st.session_state.output_queue.empty():
-                    line = st.session_state.output_queue.get_nowait()
-                    output_text += line
-            except:
-                pass
-
-            # Display live output in terminal-style
-            with output_placeholder.container():
-                st.markdown(
-                    f'<div class="terminal-output">{output_text}</div>',
-                    unsafe_allow_html=True
-                )
-
-            # Show elapsed time
-            elapsed = time.time() - start_time
-            with metrics_placeholder.container():
-                col1, col2, col3 = st.columns(3)
-                col1.metric("⏱️ Elapsed", f"{elapsed:.1f}s")
-                col2.metric("🎯 Duration", f"{duration}s")
-                col3.metric("📊 Progress", f"{min(100, elapsed/duration*100):.0f}%")
-
-            # Update every 100ms
-            time.sleep(0.1)
-
-        # Simulation complete
-        if not st.session_state.running and st.session_state.process:
+    # Simulation complete
+    elif st.session_state.result is not None:
+        result = st.session_state.result
+        if not result['success']:
+            st.error(f"❌ Simulation failed: {result['error']}")
+        else:
             st.success("✅ Simulation Complete!")
 
-            # Wait a moment for files to be written
-            time.sleep(1)
+        # The engine closes its CSVs before reporting, so only briefly poll in
+        # case the filesystem lags behind
+        wrapper = get_wrapper()
+        _wait_for_files([wrapper.signals_path, wrapper.latency_path])
 
-            # Parse final metrics
-            metrics = parse_metrics_from_output(output_text)
+        output_text = "".join(st.session_state.output_lines)
 
-            # Load CSV results
-            signals_df, latency_df = load_results()
+        # Load CSV results through the (path, mtime, size)-keyed caches
+        signals_df, latency_df = load_results(wrapper.signals_path, wrapper.latency_path)
 
-            # Display results
-            display_results(metrics, signals_df, latency_df, output_text)
+        # Display results
+        display_results(result.get('metrics', {}), signals_df, latency_df, output_text)
 
-            # Reset state
-            st.session_state.process = None
-            st.session_state.output_queue = None
-            st.session_state.stop_event = None
+        # Reset state
+        st.session_state.stream = None
+        st.session_state.result = None
+        st.session_state.output_lines = None
 
 def display_results(metrics, signals_df, latency_df, raw_output):
-    """Display simulation results with beautiful charts"""
+    """Display simulation results with beautiful charts; raw_output is HTML-escaped"""
 
     # Performance metrics
     st.header("📊 Performance Metrics")
@@ -406,10 +399,62 @@ def display_results(metrics, signals_df, latency_df, raw_output):
         display_latency_analysis(latency_df)
 
     with tab3:
-        st.markdown(
-            f'<div class="terminal-output" style="max-height: 600px;">{raw_output}</div>',
-            unsafe_allow_html=True
-        )
+        st.html(f'<pre class="terminal-output" style="max-height: 600px;">{raw_output}</pre>')
+
+def _minmax_positions(values, max_points):
+    """Row positions keeping the min and max of each of max_points / 2 windows"""
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n)
+
+    # Unlike a plain stride this never drops the spikes a timeline is read for
+    n_windows = max_points // 2
+    window = np.arange(n) * n_windows // n
+    order = np.lexsort((values, window))  # by window, then by value
+    starts = np.searchsorted(window, np.arange(n_windows))
+    ends = np.append(starts[1:], n) - 1
+    return np.unique(np.concatenate([order[starts], order[ends]]))
+
+@st.cache_data(show_spinner=False, max_entries=RESULTS_CACHE_ENTRIES)
+def _build_signal_figs(signals_df):
+    """Build the signal charts and table, cached on the DataFrame's content hash"""
+    # Signal types distribution
+    signal_counts = signals_df['type'].value_counts()
+    pie_fig = go.Figure(go.Pie(
+        labels=signal_counts.index.to_numpy(),
+        values=signal_counts.to_numpy(),
+        marker_colors=px.colors.qualitative.Set3
+    ))
+    pie_fig.update_layout(title="Signal Types Distribution")
+
+    # Signal timeline
+    timeline_df = signals_df.iloc[
+        _minmax_positions(signals_df['signal_strength'].to_numpy(), MAX_TIMELINE_POINTS)
+    ]
+    # WebGL markers, one trace per type so the legend still toggles types
+    timeline_fig = go.Figure()
+    for signal_type, group in timeline_df.groupby('type', sort=True):
+        timeline_fig.add_trace(go.Scattergl(
+            x=group['timestamp'],
+            y=group['signal_strength'],
+            mode='markers',
+            name=signal_type,
+            customdata=group[['primary_symbol', 'confidence']].to_numpy(),
+            hovertemplate=(
+                'timestamp=%{x}<br>signal_strength=%{y}<br>'
+                'primary_symbol=%{customdata[0]}<br>confidence=%{customdata[1]}'
+                f'<extra>{signal_type}</extra>'
+            )
+        ))
+    timeline_fig.update_layout(
+        title="Signal Timeline",
+        xaxis_title='timestamp',
+        yaxis_title='signal_strength',
+        legend_title_text='type'
+    )
+
+    # The loader already keeps only SIGNAL_COLUMNS; slice rows without a column copy
+    return pie_fig, timeline_fig, signals_df.head(20)
 
 def display_signals_analysis(signals_df):
     """Display signals analysis"""
@@ -417,76 +462,65 @@ def display_signals_analysis(signals_df):
         st.warning("⚠️ No signals generated. Try lowering the Z-score threshold.")
         return
 
+    pie_fig, timeline_fig, recent_signals = _build_signal_figs(signals_df)
+
     col1, col2 = st.columns(2)
 
     with col1:
-        # Signal types distribution
-        signal_counts = signals_df['type'].value_counts()
-        fig = px.pie(
-            values=signal_counts.values,
-            names=signal_counts.index,
-            title="Signal Types Distribution",
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(pie_fig, use_container_width=True)
 
     with col2:
-        # Signal timeline
-        signals_df['timestamp'] = pd.to_datetime(signals_df['timestamp'], unit='ms')
-        fig = px.scatter(
-            signals_df,
-            x='timestamp',
-            y='signal_strength',
-            color='type',
-            title="Signal Timeline",
-            hover_data=['primary_symbol', 'confidence']
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(timeline_fig, use_container_width=True)
 
     # Signals table
     st.subheader("🎯 Recent Signals")
     st.dataframe(
-        signals_df[['timestamp', 'type', 'primary_symbol', 'signal_strength', 'confidence']].head(20),
+        recent_signals,
         use_container_width=True
     )
 
+@st.cache_data(show_spinner=False, max_entries=RESULTS_CACHE_ENTRIES)
+def _build_latency_view(latency_df):
+    """Build the latency chart and P50/P95/P99, cached on the DataFrame's content hash"""
+    percentage = latency_df['percentage'].to_numpy()
+    fig = go.Figure(go.Bar(
+        x=latency_df['upper_bound_us'].to_numpy(),
+        y=percentage,
+        marker=dict(
+            color=percentage,
+            colorscale='Blues',
+            colorbar=dict(title='Percentage (%)')
+        )
+    ))
+    fig.update_layout(
+        title="Latency Distribution (microseconds)",
+        xaxis_title='Latency Upper Bound (μs)',
+        yaxis_title='Percentage (%)'
+    )
+
+    # Calculate percentiles from histogram
+    percentiles = None
+    if latency_df['count'].sum() > 0:
+        percentiles = tuple(latency_percentiles(latency_df, [0.50, 0.95, 0.99]))
+
+    return fig, percentiles
+
 def display_latency_analysis(latency_df):
     """Display latency histogram"""
     if latency_df is None or latency_df.empty:
         st.warning("⚠️ No latency data available.")
         return
 
+    fig, percentiles = _build_latency_view(latency_df)
+
     # Latency histogram
-    fig = px.bar(
-        latency_df,
-        x='upper_bound_us',
-        y='percentage',
-        title="Latency Distribution (microseconds)",
-        labels={'upper_bound_us': 'Latency Upper Bound (μs)', 'percentage': 'Percentage (%)'},
-        color='percentage',
-        color_continuous_scale='Blues'
-    )
     st.plotly_chart(fig, use_container_width=True)
 
     # Key latency metrics
     col1, col2, col3 = st.columns(3)
 
-    # Calculate percentiles from histogram
-    total_samples = latency_df['count'].sum()
-    if total_samples > 0:
-        cumulative = 0
-        p50 = p95 = p99 = 0
-
-        for _, row in latency_df.iterrows():
-            cumulative += row['count']
-            percentile = cumulative / total_samples * 100
-
-            if percentile >= 50 and p50 == 0:
-                p50 = row['upper_bound_us']
-            if percentile >= 95 and p95 == 0:
-                p95 = row['upper_bound_us']
-            if percentile >= 99 and p99 == 0:
-                p99 = row['upper_bound_us']
+    if percentiles is not None:
+        p50, p95, p99 = percentiles
 
         with col1:
             st.metric("P50 Latency", f"{p50} μs", delta="Median")
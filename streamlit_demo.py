@@ -12,6 +12,11 @@ from plotly.subplots import make_subplots
 from pathlib import Path
 import numpy as np
 
+from cpp_trading_wrapper import (
+    latency_percentiles, read_latency_csv, read_signals_csv, sample_signals_csv,
+    time_type_counts
+)
+
 # Page configuration
 st.set_page_config(
     page_title="C++ Real-Time Trading System",
@@ -20,8 +25,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Page styles, title and tech badges: static, so built once at import and
+# sent as a single element on every rerun
+HEADER_HTML = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -44,6 +50,7 @@ st.markdown("""
         padding: 1rem;
         border-radius: 10px;
         border-left: 4px solid #ff4b4b;
+        margin-bottom: 1rem;
     }
     .signal-card {
         background-color: #fff3cd;
@@ -53,10 +60,180 @@ st.markdown("""
         margin: 0.5rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+<h1 class="main-header">C++ Real-Time Trading System</h1>
+<div style="text-align: center; margin-bottom: 2rem;">
+    <span class="tech-badge">C++20</span>
+    <span class="tech-badge">Lock-Free Queues</span>
+    <span class="tech-badge">Real-Time Analytics</span>
+    <span class="tech-badge">Sub-μs Latency</span>
+    <span class="tech-badge">Welford's Algorithm</span>
+</div>
+"""
+
+# signals.csv files up to this size are loaded whole
+FULL_LOAD_BYTES = 10_000_000
+
+# Larger files are shown as a uniform random sample of this many signals
+SAMPLE_ROWS = 100_000
+
+# Percentiles shown as latency cards
+LATENCY_PERCENTILES = (50, 75, 90, 95, 99)
+
+# Time windows on the "Signals Over Time" chart
+TIME_BINS = 50
+
+# Entries kept per CSV cache. Only the current files are shown, but each
+# rewrite gets a new key, so uncapped caches would keep every old DataFrame.
+CSV_CACHE_ENTRIES = 2
+
+# Entries kept per filtered-chart cache. Their keys change with every filter
+# and slider position, so keep only recent ones rather than every combination.
+FIGURE_CACHE_ENTRIES = 16
+
+# Signal columns the demo actually uses
+SIGNAL_COLUMNS = [
+    'timestamp', 'signal_id', 'type', 'primary_symbol', 'secondary_symbol',
+    'signal_strength', 'confidence'
+]
+
+# Shown instead of the dashboard when no exported data is found (e.g. on
+# Streamlit Cloud); static, so built once at import
+LOCAL_SETUP_MD = """
+## This Demo Requires Local Setup
+
+This C++ trading system needs to be **compiled and run locally** because:
+- It's a native C++ executable (compiled binary)
+- Streamlit Cloud runs on Linux, but the code needs to be compiled for your OS
+- Live performance requires local hardware access
+
+### To Run Locally:
+
+```bash
+# Clone the repository
+git clone https://github.com/arav-behl/cpp_project
+cd cpp_project
+
+# Build the C++ system
+cmake -S . -B build && cmake --build build -j8
+
+# Option 1: Run in terminal (recommended)
+./build/demo_realtime --duration 30 --rate 2000
+
+# Option 2: Run this Streamlit dashboard
+pip install streamlit pandas plotly
+streamlit run streamlit_demo.py
+```
+
+### What You'll See:
+
+- **Live terminal output** streaming in real-time
+- **Signal detections** as they fire (Z-score, correlation breaks)
+- **Latency statistics** (P50/P95/P99 in microseconds)
+- **Throughput metrics** (thousands of ticks per second)
+- **Performance charts** with interactive visualizations
+
+---
+
+### Architecture Overview
+
+```
+┌─────────────────┐
+│ Feed Simulator  │ ← GBM/OU pricing models
+└────────┬────────┘
+         │
+         ▼
+┌─────────────────┐
+│ SPSC Queue 64K  │ ← Lock-free, cache-aligned
+└────────┬────────┘
+         │
+         ▼
+┌─────────────────┐
+│ Signal Engine   │ ← Z-score, correlation, volume
+└────────┬────────┘
+         │
+         ▼
+┌─────────────────┐
+│ Latency Monitor │ ← P50/P95/P99 tracking
+└─────────────────┘
+```
+
+### Key Technical Features:
+
+- **Lock-Free Concurrency**: SPSC queue with acquire/release memory ordering
+- **Numerical Stability**: Welford's algorithm for streaming variance
+- **Cache-Aware Design**: alignas(64) to prevent false sharing
+- **Zero-Copy**: Move semantics and string_view for hot path
+- **Sub-Millisecond Latency**: Steady clock timestamps, bounded memory
+
+### Performance Benchmarks:
+
+Typical results on modern hardware:
+- **Throughput**: 1-5M ticks/sec
+- **P50 Latency**: 100-300μs
+- **P99 Latency**: 1-3ms
+- **Queue Efficiency**: >99.9%
+
+---
+
+**GitHub Repository**: https://github.com/arav-behl/cpp_project
+"""
+
+EXAMPLE_OUTPUT = """
+╔══════════════════════════════════════════════════════════════╗
+║              REAL-TIME TRADING SYSTEM                        ║
+║                    C++20 Low-Latency Engine                  ║
+╠══════════════════════════════════════════════════════════════╣
+║ Runtime: 15s                                                 ║
+║ Feed: 120000 ticks | Dropped: 0 (0.00%)                    ║
+║ Queue: 12.5% full                                           ║
+║ Processed: 120000 ticks | Rate: 8000 TPS                   ║
+║ Signals: 23                                                 ║
+║ Latency: P50=125μs | P95=380μs | P99=950μs                 ║
+╚══════════════════════════════════════════════════════════════╝
+
+SIGNAL 000001 | ZBreak | AAPL | strength=2.61 | lat=120μs
+SIGNAL 000002 | CorrBreak | AAPL/MSFT | strength=0.18 | lat=135μs
+SIGNAL 000003 | VolSpike | TSLA | strength=3.42 | lat=98μs
+"""
+
+@st.cache_data(show_spinner=False, max_entries=CSV_CACHE_ENTRIES)
+def _read_signals(path, mtime_ns, size):
+    """Load signals.csv, sampling it if large; mtime_ns and size only key the cache"""
+    # Labels come back as categoricals, so filters and counts work on int codes
+    if size <= FULL_LOAD_BYTES:
+        signals_df = read_signals_csv(path, columns=SIGNAL_COLUMNS, categorical=True)
+        total_signals = len(signals_df)
+    else:
+        # One streaming pass; the sample spans the whole run rather than
+        # just its first seconds
+        signals_df, total_signals = sample_signals_csv(
+            path, SAMPLE_ROWS, columns=SIGNAL_COLUMNS, categorical=True
+        )
+
+    # Convert timestamp to seconds for better readability
+    signals_df['timestamp_sec'] = signals_df['timestamp'].to_numpy() / 1_000_000
+    return signals_df, total_signals
+
+@st.cache_data(show_spinner=False, max_entries=CSV_CACHE_ENTRIES)
+def _read_latency(path, mtime_ns, size):
+    """Parse latency_histogram.csv; mtime_ns and size only key the cache"""
+    # Same typed reader as the live dashboard, so both see the same dtypes
+    return read_latency_csv(path)
+
+def _file_version(path):
+    """(mtime_ns, size) of a file; size catches rewrites within one coarse mtime tick"""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+def _category_mask(labels, value):
+    """Rows of a categorical Series equal to value, compared on the int codes"""
+    if value not in labels.cat.categories:
+        # Code -1 marks missing values, so never match against it
+        return np.zeros(len(labels), dtype=bool)
+    return labels.cat.codes.to_numpy() == labels.cat.categories.get_loc(value)
 
 def load_data():
-    """Load CSV data files"""
+    """Load CSV data files, reparsing them only when they change on disk"""
     data_dir = Path("data")
 
     signals_df = None
@@ -66,18 +243,9 @@ def load_data():
     signals_path = data_dir / "signals.csv"
     if signals_path.exists():
         try:
-            # For very large files, sample the data
-            file_size = signals_path.stat().st_size
-            if file_size > 10_000_000:  # If larger than 10MB
-                # Sample 100k rows
-                signals_df = pd.read_csv(signals_path, nrows=100_000)
-                st.info(f"📊 Large dataset detected ({file_size / 1_000_000:.1f}MB). Showing sample of 100k signals.")
-            else:
-                signals_df = pd.read_csv(signals_path)
-
-            # Convert timestamp to seconds for better readability
-            if 'timestamp' in signals_df.columns:
-                signals_df['timestamp_sec'] = signals_df['timestamp'] / 1_000_000
+            signals_df, total_signals = _read_signals(signals_path, *_file_version(signals_path))
+            if total_signals > len(signals_df):
+                st.info(f"📊 Large dataset detected ({total_signals:,} signals). Showing a random sample of {len(signals_df):,} signals.")
         except Exception as e:
             st.error(f"Error loading signals.csv: {e}")
 
@@ -85,25 +253,317 @@ def load_data():
     latency_path = data_dir / "latency_histogram.csv"
     if latency_path.exists():
         try:
-            latency_df = pd.read_csv(latency_path)
+            latency_df = _read_latency(latency_path, *_file_version(latency_path))
         except Exception as e:
             st.error(f"Error loading latency_histogram.csv: {e}")
 
     return signals_df, latency_df
 
+@st.cache_data(show_spinner=False, max_entries=CSV_CACHE_ENTRIES)
+def _latency_stats(latency_df):
+    """Average and percentile latencies (μs) of the histogram, computed once per file"""
+    # Weighted average using bucket midpoints
+    midpoint = (latency_df['lower_bound_us'].to_numpy() + latency_df['upper_bound_us'].to_numpy()) / 2
+    counts = latency_df['count'].to_numpy()
+
+    # All percentiles in one pass over the cumulative counts
+    bounds = latency_percentiles(latency_df, np.array(LATENCY_PERCENTILES) / 100)
+    return {
+        'avg': float((midpoint * counts).sum() / counts.sum()),
+        'percentiles': dict(zip(LATENCY_PERCENTILES, bounds.tolist())),
+    }
+
+# Figure builders take small hashable aggregates (or the cached latency
+# histogram), so widget changes that leave a chart's inputs alone reuse it
+
+@st.cache_data(show_spinner=False, max_entries=CSV_CACHE_ENTRIES)
+def _latency_fig(latency_df):
+    """Latency histogram, cached on the DataFrame's content hash"""
+    fig_latency = go.Figure()
+
+    # Filter out extreme outliers for better visualization
+    display_latency = latency_df[latency_df['upper_bound_us'] <= 50000]
+
+    # Format labels from the raw columns rather than a Series per row
+    lower = display_latency['lower_bound_us'].to_numpy(dtype=np.int64)
+    upper = display_latency['upper_bound_us'].to_numpy(dtype=np.int64)
+    percentage = display_latency['percentage'].to_numpy()
+
+    fig_latency.add_trace(go.Bar(
+        x=[f"{lo}-{hi}" for lo, hi in zip(lower, upper)],
+        y=percentage,
+        text=[f"{p:.2f}%" for p in percentage],
+        textposition='auto',
+        marker_color='#ff4b4b',
+        hovertemplate='<b>%{x} μs</b><br>%{y:.2f}%<extra></extra>'
+    ))
+
+    fig_latency.update_layout(
+        title="Latency Histogram (< 50ms range)",
+        xaxis_title="Latency Range (μs)",
+        yaxis_title="Percentage (%)",
+        height=400,
+        hovermode='x unified',
+        showlegend=False
+    )
+    return fig_latency
+
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _signal_types_fig(labels, values):
+    fig_signal_types = go.Figure(data=[go.Pie(
+        labels=labels,
+        values=values,
+        hole=0.4,
+        marker=dict(colors=['#ff4b4b', '#ffa600', '#00cc96'])
+    )])
+
+    fig_signal_types.update_layout(
+        title="Signal Type Distribution",
+        height=400
+    )
+    return fig_signal_types
+
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _strength_fig(counts, edges):
+    edges = np.asarray(edges)
+    fig_strength = go.Figure(data=[go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color='#ff4b4b'
+    )])
+    fig_strength.update_layout(
+        title="Signal Strength Distribution",
+        xaxis_title="signal_strength",
+        yaxis_title="count",
+        bargap=0,
+        height=400
+    )
+    return fig_strength
+
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _timeline_fig(edges, type_names, counts):
+    """Signal frequency per time window; counts is window-major, one per type"""
+    edges = np.asarray(edges)
+    signals_over_time = pd.DataFrame({
+        'time_midpoint': np.repeat((edges[:-1] + edges[1:]) / 2, len(type_names)),
+        'type': np.tile(type_names, len(edges) - 1),
+        'count': counts
+    })
+
+    fig_timeline = px.line(
+        signals_over_time,
+        x='time_midpoint',
+        y='count',
+        color='type',
+        title="Signal Frequency Over Time",
+        labels={'time_midpoint': 'Time (seconds)', 'count': 'Signal Count'},
+        color_discrete_sequence=['#ff4b4b', '#ffa600', '#00cc96']
+    )
+
+    fig_timeline.update_layout(height=400, hovermode='x unified')
+    return fig_timeline
+
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _pairs_fig(labels, counts):
+    fig_pairs = go.Figure(data=[go.Bar(
+        x=counts,
+        y=labels,
+        orientation='h',
+        marker_color='#ff4b4b',
+        text=counts,
+        textposition='auto'
+    )])
+
+    fig_pairs.update_layout(
+        title="Top 10 Most Active Pairs (Correlation Breaks)",
+        xaxis_title="Signal Count",
+        yaxis_title="Symbol Pair",
+        height=400
+    )
+    return fig_pairs
+
+@st.fragment
+def signal_explorer(signals_df, latency_df):
+    """Filters and every chart that depends on them; a filter change reruns only this"""
+    # ========================================
+    # FILTER CONTROLS
+    # ========================================
+    # Kept out of the sidebar: a fragment can only rerun widgets inside it
+    st.markdown("## Signal Explorer")
+
+    col1, col2, col3 = st.columns([1, 1, 2])
+
+    with col1:
+        # Signal type filter
+        signal_types = ['All'] + sorted(signals_df['type'].unique().tolist())
+        selected_signal_type = st.selectbox("Signal Type", signal_types)
+
+    with col2:
+        # Symbol filter; both symbol columns share one sorted category list
+        all_symbols = ['All'] + signals_df['primary_symbol'].cat.categories.tolist()
+        selected_symbol = st.selectbox("Symbol", all_symbols)
+
+    with col3:
+        # Time range
+        if 'timestamp_sec' in signals_df.columns:
+            min_time = float(signals_df['timestamp_sec'].min())
+            max_time = float(signals_df['timestamp_sec'].max())
+            time_range = st.slider(
+                "Time Range (seconds)",
+                min_value=min_time,
+                max_value=max_time,
+                value=(min_time, max_time)
+            )
+
+    # ========================================
+    # FILTER DATA
+    # ========================================
+    # Combine every filter into one mask so the frame is indexed only once
+    mask = np.ones(len(signals_df), dtype=bool)
+
+    if selected_signal_type != 'All':
+        mask &= _category_mask(signals_df['type'], selected_signal_type)
+
+    if selected_symbol != 'All':
+        # Shared categories: one code, matched against either column
+        symbol_code = signals_df['primary_symbol'].cat.categories.get_loc(selected_symbol)
+        mask &= (
+            (signals_df['primary_symbol'].cat.codes.to_numpy() == symbol_code) |
+            (signals_df['secondary_symbol'].cat.codes.to_numpy() == symbol_code)
+        )
+
+    if 'timestamp_sec' in signals_df.columns:
+        t = signals_df['timestamp_sec'].to_numpy()
+        mask &= (t >= time_range[0]) & (t <= time_range[1])
+
+    filtered_signals = signals_df.iloc[mask]
+
+    # ========================================
+    # KEY METRICS ROW
+    # ========================================
+    st.markdown("## Performance Metrics")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        total_signals = len(filtered_signals)
+        st.metric("Total Signals", f"{total_signals:,}")
+
+    latency_stats = _latency_stats(latency_df)
+
+    with col2:
+        st.metric("Avg Latency", f"{latency_stats['avg']:.0f} μs")
+
+    with col3:
+        st.metric("P99 Latency", f"{latency_stats['percentiles'][99]:.0f} μs")
+
+    with col4:
+        unique_pairs = filtered_signals[['primary_symbol', 'secondary_symbol']].drop_duplicates()
+        st.metric("Active Pairs", len(unique_pairs))
+
+    st.markdown("---")
+
+    # ========================================
+    # SIGNAL ANALYSIS
+    # ========================================
+    st.markdown("## Signal Analysis")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Signal type distribution
+        signal_counts = filtered_signals['type'].value_counts()
+        signal_counts = signal_counts[signal_counts > 0]  # categoricals count every type
+
+        fig_signal_types = _signal_types_fig(
+            tuple(signal_counts.index), tuple(signal_counts.tolist())
+        )
+        st.plotly_chart(fig_signal_types, use_container_width=True)
+
+    with col2:
+        # Signal strength distribution
+        if 'signal_strength' in filtered_signals.columns:
+            # Bin here so the figure carries 30 bars rather than every signal
+            strength = filtered_signals['signal_strength'].to_numpy()
+            counts, edges = np.histogram(strength[strength > 0], bins=30)
+            fig_strength = _strength_fig(tuple(counts.tolist()), tuple(edges.tolist()))
+            st.plotly_chart(fig_strength, use_container_width=True)
+
+    # ========================================
+    # SIGNALS OVER TIME
+    # ========================================
+    if 'timestamp_sec' in filtered_signals.columns:
+        st.markdown("## Signals Over Time")
+
+        # Count signals per (time window, type) straight into a 2D array
+        types = filtered_signals['type'].cat
+        edges, counts = time_type_counts(
+            filtered_signals['timestamp_sec'].to_numpy(),
+            types.codes.to_numpy(),
+            TIME_BINS,
+            len(types.categories)
+        )
+        # Keep only types present after filtering, so filtered-out types get
+        # no flat line and colours follow the types actually shown
+        present = counts.sum(axis=0) > 0
+        fig_timeline = _timeline_fig(
+            tuple(edges.tolist()),
+            tuple(types.categories[present]),
+            tuple(counts[:, present].ravel().tolist())
+        )
+        st.plotly_chart(fig_timeline, use_container_width=True)
+
+    st.markdown("---")
+
+    # ========================================
+    # SYMBOL PAIR ANALYSIS
+    # ========================================
+    st.markdown("## Symbol Pair Analysis")
+
+    # Get correlation break signals
+    corr_signals = filtered_signals[
+        (filtered_signals['type'] == 'CorrBreak') &
+        (filtered_signals['secondary_symbol'].notna())
+    ]
+
+    if len(corr_signals) > 0:
+        # Count signals per pair on the category codes; only the top 10 get labels
+        pair_counts = corr_signals.groupby(
+            ['primary_symbol', 'secondary_symbol'], observed=True
+        ).size().nlargest(10)
+        pair_labels = tuple(f"{a} / {b}" for a, b in pair_counts.index)
+
+        fig_pairs = _pairs_fig(pair_labels, tuple(pair_counts.tolist()))
+        st.plotly_chart(fig_pairs, use_container_width=True)
+
+    # ========================================
+    # RECENT SIGNALS TABLE
+    # ========================================
+    st.markdown("## Recent Signals")
+
+    # Show top signals
+    display_columns = ['timestamp_sec', 'signal_id', 'type', 'primary_symbol', 'secondary_symbol', 'signal_strength', 'confidence']
+    display_columns = [col for col in display_columns if col in filtered_signals.columns]
+
+    recent_signals = filtered_signals.nlargest(100, 'signal_id')[display_columns]
+
+    # Formatting happens in the frontend, so the columns keep their dtypes
+    st.dataframe(
+        recent_signals,
+        use_container_width=True,
+        height=400,
+        column_config={
+            'timestamp_sec': st.column_config.NumberColumn(format="%.3f"),
+            'signal_strength': st.column_config.NumberColumn(format="%.3f"),
+            'confidence': st.column_config.NumberColumn(format="%.3f"),
+        }
+    )
+
+
 def main():
     # Title
-    st.markdown('<h1 class="main-header">C++ Real-Time Trading System</h1>', unsafe_allow_html=True)
-
-    st.markdown("""
-    <div style="text-align: center; margin-bottom: 2rem;">
-        <span class="tech-badge">C++20</span>
-        <span class="tech-badge">Lock-Free Queues</span>
-        <span class="tech-badge">Real-Time Analytics</span>
-        <span class="tech-badge">Sub-μs Latency</span>
-        <span class="tech-badge">Welford's Algorithm</span>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
     # Load data
     signals_df, latency_df = load_data()
@@ -113,105 +573,11 @@ def main():
 
     if not has_data:
         st.error("This demo requires local C++ compilation")
-        st.markdown("""
-        ## This Demo Requires Local Setup
-
-        This C++ trading system needs to be **compiled and run locally** because:
-        - It's a native C++ executable (compiled binary)
-        - Streamlit Cloud runs on Linux, but the code needs to be compiled for your OS
-        - Live performance requires local hardware access
-
-        ### To Run Locally:
-
-        ```bash
-        # Clone the repository
-        git clone https://github.com/arav-behl/cpp_project
-        cd cpp_project
-
-        # Build the C++ system
-        cmake -S . -B build && cmake --build build -j8
-
-        # Option 1: Run in terminal (recommended)
-        ./build/demo_realtime --duration 30 --rate 2000
-
-        # Option 2: Run this Streamlit dashboard
-        pip install streamlit pandas plotly
-        streamlit run streamlit_demo.py
-        ```
-
-        ### What You'll See:
-
-        - **Live terminal output** streaming in real-time
-        - **Signal detections** as they fire (Z-score, correlation breaks)
-        - **Latency statistics** (P50/P95/P99 in microseconds)
-        - **Throughput metrics** (thousands of ticks per second)
-        - **Performance charts** with interactive visualizations
-
-        ---
-
-        ### Architecture Overview
-
-        ```
-        ┌─────────────────┐
-        │ Feed Simulator  │ ← GBM/OU pricing models
-        └────────┬────────┘
-                 │
-                 ▼
-        ┌─────────────────┐
-        │ SPSC Queue 64K  │ ← Lock-free, cache-aligned
-        └────────┬────────┘
-                 │
-                 ▼
-        ┌─────────────────┐
-        │ Signal Engine   │ ← Z-score, correlation, volume
-        └────────┬────────┘
-                 │
-                 ▼
-        ┌─────────────────┐
-        │ Latency Monitor │ ← P50/P95/P99 tracking
-        └─────────────────┘
-        ```
-
-        ### Key Technical Features:
-
-        - **Lock-Free Concurrency**: SPSC queue with acquire/release memory ordering
-        - **Numerical Stability**: Welford's algorithm for streaming variance
-        - **Cache-Aware Design**: alignas(64) to prevent false sharing
-        - **Zero-Copy**: Move semantics and string_view for hot path
-        - **Sub-Millisecond Latency**: Steady clock timestamps, bounded memory
-
-        ### Performance Benchmarks:
-
-        Typical results on modern hardware:
-        - **Throughput**: 1-5M ticks/sec
-        - **P50 Latency**: 100-300μs
-        - **P99 Latency**: 1-3ms
-        - **Queue Efficiency**: >99.9%
-
-        ---
-
-        **GitHub Repository**: https://github.com/arav-behl/cpp_project
-        """)
+        st.markdown(LOCAL_SETUP_MD)
 
         # Show example output
         st.markdown("### Example Terminal Output")
-        st.code("""
-╔══════════════════════════════════════════════════════════════╗
-║              REAL-TIME TRADING SYSTEM                        ║
-║                    C++20 Low-Latency Engine                  ║
-╠══════════════════════════════════════════════════════════════╣
-║ Runtime: 15s                                                 ║
-║ Feed: 120000 ticks | Dropped: 0 (0.00%)                    ║
-║ Queue: 12.5% full                                           ║
-║ Processed: 120000 ticks | Rate: 8000 TPS                   ║
-║ Signals: 23                                                 ║
-║ Latency: P50=125μs | P95=380μs | P99=950μs                 ║
-╚══════════════════════════════════════════════════════════════╝
-
-SIGNAL 000001 | ZBreak | AAPL | strength=2.61 | lat=120μs
-SIGNAL 000002 | CorrBreak | AAPL/MSFT | strength=0.18 | lat=135μs
-SIGNAL 000003 | VolSpike | TSLA | strength=3.42 | lat=98μs
-        """, language="text")
+        st.code(EXAMPLE_OUTPUT, language="text")
 
     else:
         # ========================================
@@ -220,36 +586,7 @@ SIGNAL 000003 | VolSpike | TSLA | strength=3.42 | lat=98μs
 
         st.success("Data loaded successfully!")
 
-        # ========================================
-        # SIDEBAR CONTROLS
-        # ========================================
         with st.sidebar:
-            st.header("Dashboard Controls")
-
-            # Signal type filter
-            signal_types = ['All'] + sorted(signals_df['type'].unique().tolist())
-            selected_signal_type = st.selectbox("Signal Type", signal_types)
-
-            # Symbol filter
-            all_symbols = set()
-            for col in ['primary_symbol', 'secondary_symbol']:
-                if col in signals_df.columns:
-                    all_symbols.update(signals_df[col].dropna().unique())
-            all_symbols = ['All'] + sorted(list(all_symbols))
-            selected_symbol = st.selectbox("Symbol", all_symbols)
-
-            # Time range
-            if 'timestamp_sec' in signals_df.columns:
-                min_time = float(signals_df['timestamp_sec'].min())
-                max_time = float(signals_df['timestamp_sec'].max())
-                time_range = st.slider(
-                    "Time Range (seconds)",
-                    min_value=min_time,
-                    max_value=max_time,
-                    value=(min_time, max_time)
-                )
-
-            st.markdown("---")
             st.markdown("### About This System")
             st.markdown("""
             **Architecture:**
@@ -263,58 +600,6 @@ SIGNAL 000003 | VolSpike | TSLA | strength=3.42 | lat=98μs
             - Volume spikes
             """)
 
-        # ========================================
-        # FILTER DATA
-        # ========================================
-        filtered_signals = signals_df.copy()
-
-        if selected_signal_type != 'All':
-            filtered_signals = filtered_signals[filtered_signals['type'] == selected_signal_type]
-
-        if selected_symbol != 'All':
-            filtered_signals = filtered_signals[
-                (filtered_signals['primary_symbol'] == selected_symbol) |
-                (filtered_signals['secondary_symbol'] == selected_symbol)
-            ]
-
-        if 'timestamp_sec' in filtered_signals.columns:
-            filtered_signals = filtered_signals[
-                (filtered_signals['timestamp_sec'] >= time_range[0]) &
-                (filtered_signals['timestamp_sec'] <= time_range[1])
-            ]
-
-        # ========================================
-        # KEY METRICS ROW
-        # ========================================
-        st.markdown("## Performance Metrics")
-
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            total_signals = len(filtered_signals)
-            st.metric("Total Signals", f"{total_signals:,}")
-
-        with col2:
-            # Calculate average latency from histogram
-            if latency_df is not None and 'count' in latency_df.columns:
-                total_samples = latency_df['count'].sum()
-                # Weighted average using bucket midpoints
-                latency_df['midpoint'] = (latency_df['lower_bound_us'] + latency_df['upper_bound_us']) / 2
-                avg_latency = (latency_df['midpoint'] * latency_df['count']).sum() / total_samples
-                st.metric("Avg Latency", f"{avg_latency:.0f} μs")
-
-        with col3:
-            # Calculate P99 latency
-            cumsum = latency_df['percentage'].cumsum()
-            p99_bucket = latency_df[cumsum >= 99.0].iloc[0] if len(latency_df[cumsum >= 99.0]) > 0 else latency_df.iloc[-1]
-            st.metric("P99 Latency", f"{p99_bucket['upper_bound_us']:.0f} μs")
-
-        with col4:
-            unique_pairs = filtered_signals[['primary_symbol', 'secondary_symbol']].drop_duplicates()
-            st.metric("Active Pairs", len(unique_pairs))
-
-        st.markdown("---")
-
         # ========================================
         # LATENCY DISTRIBUTION
         # ========================================
@@ -324,166 +609,21 @@ SIGNAL 000003 | VolSpike | TSLA | strength=3.42 | lat=98μs
 
         with col1:
             # Latency histogram
-            fig_latency = go.Figure()
-
-            # Filter out extreme outliers for better visualization
-            display_latency = latency_df[latency_df['upper_bound_us'] <= 50000].copy()
-
-            fig_latency.add_trace(go.Bar(
-                x=[f"{int(row['lower_bound_us'])}-{int(row['upper_bound_us'])}" for _, row in display_latency.iterrows()],
-                y=display_latency['percentage'],
-                text=[f"{p:.2f}%" for p in display_latency['percentage']],
-                textposition='auto',
-                marker_color='#ff4b4b',
-                hovertemplate='<b>%{x} μs</b><br>%{y:.2f}%<extra></extra>'
-            ))
-
-            fig_latency.update_layout(
-                title="Latency Histogram (< 50ms range)",
-                xaxis_title="Latency Range (μs)",
-                yaxis_title="Percentage (%)",
-                height=400,
-                hovermode='x unified',
-                showlegend=False
-            )
-
-            st.plotly_chart(fig_latency, use_container_width=True)
+            st.plotly_chart(_latency_fig(latency_df), use_container_width=True)
 
         with col2:
             st.markdown("### Latency Percentiles")
 
-            # Calculate percentiles
-            percentiles = [50, 75, 90, 95, 99]
-            cumsum = latency_df['percentage'].cumsum()
-
-            for p in percentiles:
-                bucket = latency_df[cumsum >= p].iloc[0] if len(latency_df[cumsum >= p]) > 0 else latency_df.iloc[-1]
-                st.markdown(f"""
-                <div class="metric-card">
-                    <strong>P{p}</strong>: {bucket['upper_bound_us']:.0f} μs
-                </div>
-                """, unsafe_allow_html=True)
+            # One element for all the cards rather than one per percentile
+            st.markdown("".join(
+                f'<div class="metric-card"><strong>P{p}</strong>: {bound:.0f} μs</div>'
+                for p, bound in _latency_stats(latency_df)['percentiles'].items()
+            ), unsafe_allow_html=True)
 
         st.markdown("---")
 
-        # ========================================
-        # SIGNAL ANALYSIS
-        # ========================================
-        st.markdown("## Signal Analysis")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Signal type distribution
-            signal_counts = filtered_signals['type'].value_counts()
-
-            fig_signal_types = go.Figure(data=[go.Pie(
-                labels=signal_counts.index,
-                values=signal_counts.values,
-                hole=0.4,
-                marker=dict(colors=['#ff4b4b', '#ffa600', '#00cc96'])
-            )])
-
-            fig_signal_types.update_layout(
-                title="Signal Type Distribution",
-                height=400
-            )
-
-            st.plotly_chart(fig_signal_types, use_container_width=True)
-
-        with col2:
-            # Signal strength distribution
-            if 'signal_strength' in filtered_signals.columns:
-                fig_strength = px.histogram(
-                    filtered_signals[filtered_signals['signal_strength'] > 0],
-                    x='signal_strength',
-                    nbins=30,
-                    title="Signal Strength Distribution",
-                    color_discrete_sequence=['#ff4b4b']
-                )
-                fig_strength.update_layout(height=400)
-                st.plotly_chart(fig_strength, use_container_width=True)
-
-        # ========================================
-        # SIGNALS OVER TIME
-        # ========================================
-        if 'timestamp_sec' in filtered_signals.columns:
-            st.markdown("## Signals Over Time")
-
-            # Group signals by time windows
-            time_bins = pd.cut(filtered_signals['timestamp_sec'], bins=50)
-            signals_over_time = filtered_signals.groupby([time_bins, 'type']).size().reset_index(name='count')
-            signals_over_time['time_midpoint'] = signals_over_time['timestamp_sec'].apply(lambda x: x.mid)
-
-            fig_timeline = px.line(
-                signals_over_time,
-                x='time_midpoint',
-                y='count',
-                color='type',
-                title="Signal Frequency Over Time",
-                labels={'time_midpoint': 'Time (seconds)', 'count': 'Signal Count'},
-                color_discrete_sequence=['#ff4b4b', '#ffa600', '#00cc96']
-            )
-
-            fig_timeline.update_layout(height=400, hovermode='x unified')
-            st.plotly_chart(fig_timeline, use_container_width=True)
-
-        st.markdown("---")
-
-        # ========================================
-        # SYMBOL PAIR ANALYSIS
-        # ========================================
-        st.markdown("## Symbol Pair Analysis")
-
-        # Get correlation break signals
-        corr_signals = filtered_signals[
-            (filtered_signals['type'] == 'CorrBreak') &
-            (filtered_signals['secondary_symbol'].notna())
-        ]
-
-        if len(corr_signals) > 0:
-            # Count signals per pair
-            corr_signals['pair'] = corr_signals['primary_symbol'] + ' / ' + corr_signals['secondary_symbol']
-            pair_counts = corr_signals['pair'].value_counts().head(10)
-
-            fig_pairs = go.Figure(data=[go.Bar(
-                x=pair_counts.values,
-                y=pair_counts.index,
-                orientation='h',
-                marker_color='#ff4b4b',
-                text=pair_counts.values,
-                textposition='auto'
-            )])
-
-            fig_pairs.update_layout(
-                title="Top 10 Most Active Pairs (Correlation Breaks)",
-                xaxis_title="Signal Count",
-                yaxis_title="Symbol Pair",
-                height=400
-            )
-
-            st.plotly_chart(fig_pairs, use_container_width=True)
-
-        # ========================================
-        # RECENT SIGNALS TABLE
-        # ========================================
-        st.markdown("## Recent Signals")
-
-        # Show top signals
-        display_columns = ['timestamp_sec', 'signal_id', 'type', 'primary_symbol', 'secondary_symbol', 'signal_strength', 'confidence']
-        display_columns = [col for col in display_columns if col in filtered_signals.columns]
-
-        recent_signals = filtered_signals.nlargest(100, 'signal_id')[display_columns]
-
-        # Format for display
-        if 'timestamp_sec' in recent_signals.columns:
-            recent_signals['timestamp_sec'] = recent_signals['timestamp_sec'].round(3)
-
-        st.dataframe(
-            recent_signals,
-            use_container_width=True,
-            height=400
-        )
+        # Filters, metrics and signal charts rerun on their own when a filter changes
+        signal_explorer(signals_df, latency_df)
 
         # ========================================
         # TECHNICAL DETAILS EXPANDER
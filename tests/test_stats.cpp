@@ -167,6 +167,7 @@ void test_windowed_stats() {
     windowed.add(6.0);
     assert(windowed.count() == 5);
     assert(close_enough(windowed.mean(), 4.0)); // Mean of [2,3,4,5,6]
+    assert(close_enough(windowed.variance(), 2.5));
 
     std::cout << "✅ WindowedStats tests passed\n";
 }